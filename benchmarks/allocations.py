@@ -0,0 +1,101 @@
+import tracemalloc
+from srcs.lexer import Lexer
+from srcs.parser import Parser
+from srcs.resolver import Resolver
+from srcs.interpreter import Interpreter
+from srcs.base.context import Context
+from srcs.base.symbol_table import SymbolTable
+from srcs.base.number import Number
+from srcs.base.string import String
+from srcs.base.value import Value
+from srcs.base.signals.error_signal import ErrorSignal
+from srcs.base.nodes.variable_access_node import VariableAccessNode
+from srcs.errors.run_time_error import RunTimeError
+
+READS = 100000
+
+
+class CopyingInterpreter(Interpreter):
+    def visit_VariableAccessNode(
+        self, node: "VariableAccessNode", context: "Context"
+    ) -> "Value":
+        variable_name = node.variable_name_token.value
+        value = context.symbol_table.lookup(variable_name, node.depth, node.slot)
+        if not value:
+            raise ErrorSignal(
+                RunTimeError(
+                    node.position_start,
+                    node.position_end,
+                    f"'{variable_name}' is not defined",
+                    context,
+                )
+            )
+        return (
+            value.copy()
+            .set_position(node.position_start, node.position_end)
+            .set_context(context)
+        )
+
+
+def parse(text: str):
+    tokens, _ = Lexer("<benchmark>", text).make_tokens()
+    return Resolver().resolve(Parser(tokens).parse().node).element_nodes[0]
+
+
+def allocations(interpreter: "Interpreter", node, context: "Context") -> tuple:
+    values = [None] * READS
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for i in range(READS):
+        values[i] = interpreter.evaluate(node, context)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    statistics = after.compare_to(before, "filename")
+    blocks = sum(statistic.count_diff for statistic in statistics)
+    size = sum(statistic.size_diff for statistic in statistics)
+    return blocks / READS, size / READS
+
+
+def benchmark_reads() -> None:
+    context = Context("<benchmark>")
+    context.symbol_table = SymbolTable()
+    context.symbol_table.set("number", Number(42))
+    context.symbol_table.set("string", String("arcane"))
+
+    for name in ("number", "string"):
+        node = parse(name)
+        before = allocations(CopyingInterpreter(), node, context)
+        after = allocations(Interpreter(), node, context)
+        report(f"read of {name} (per access)", before, after)
+
+
+def benchmark_arithmetic() -> None:
+    context = Context("<benchmark>")
+    context.symbol_table = SymbolTable()
+    context.symbol_table.set("number", Number(42))
+    node = parse("(number * 3 + 1) % 100 < 50")
+
+    Number.set_cache(False)
+    before = allocations(Interpreter(), node, context)
+    Number.set_cache(True)
+    after = allocations(Interpreter(), node, context)
+    report("small-int arithmetic", before, after, "uncached", "cached")
+
+
+def report(
+    name: str,
+    before: tuple,
+    after: tuple,
+    before_label: str = "copying",
+    after_label: str = "shared",
+) -> None:
+    print(
+        f"{name:<28} {before_label} {before[0]:6.2f} blocks {before[1]:7.1f} B"
+        f"   {after_label} {after[0]:6.2f} blocks {after[1]:7.1f} B"
+    )
+
+
+if __name__ == "__main__":
+    benchmark_reads()
+    benchmark_arithmetic()
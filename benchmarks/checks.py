@@ -0,0 +1,241 @@
+import os
+import sys
+from io import StringIO
+from functools import partial
+from random import Random
+from tempfile import TemporaryDirectory
+from threading import Thread
+from srcs.shell import run, execute
+from srcs.program_cache import ProgramCache
+from srcs.environment import Environment
+from srcs.base.string import String
+from srcs.base.array import Array
+
+DIRECTORY = os.path.join(os.path.dirname(__file__), "programs")
+SNIPPETS = (
+    "auto x = 7\nprint(x * 3 - 1 / 4)\nx ^ 2 % 5",
+    "auto a = for i = 0 to 5 then i * 2\nauto b = for i = 5 to 0 decrement 1 then i\n[a, b]",
+    "auto r = for i = 0 to 10 then\n  if i == 3 then continue\n  if i == 7 then break\n  i * i\nend\nr",
+    "auto n = 0\nwhile n < 5 then auto n = n + 1\nn",
+    "const fact(n)\n  if n <= 1 then return 1\n  return n * fact(n - 1)\nend\nfact(20)",
+    "const fib(n) => if n < 2 then n else fib(n - 1) + fib(n - 2)\nfib(12)",
+    "const outer(x)\n  const inner(y) => x + y\n  return inner(10)\nend\nouter(5)",
+    "const brk()\n  for i = 0 to 10 then\n    if i == 4 then break\n  end\n  return i\nend\nbrk()",
+    'auto s = ""\nfor i = 0 to 300 then auto s = s + "ab"\n[len(s), s / 599, s == "ab" * 301]',
+    'auto t = "x" * 300\nauto u = t + "y"\nauto v = t + "z"\n[u / 300, v / 300, len(u + v)]',
+    "auto xs = [1, [2, 3]]\nauto ys = xs\nappend(ys, 4)\n[xs, xs / 1, len(xs)]",
+    "map(range(0, 10), const (x) => x * x)",
+    "reduce(filter(range(0, 20), const (x) => x % 3 == 0), const (a, b) => a + b, 0)",
+    'join(map([1, 2, 3], const (x) => "<" + x + ">"), ", ")',
+    "auto a = to_array([3, 1, 2])\n[a * 2 + 1, a ^ 2, sort(a), sum(a), min(a), max(a), mean(a)]",
+    "to_array([1, 2]) / to_array([0, 1])",
+    "to_array([10]) ^ 400",
+    "print(1 / 0)",
+    "auto x = undefined + 1",
+    "[1, 2] / 5",
+    "const f(a) => a\nf(1, 2)",
+    "auto x = 1 +",
+    "auto x = 1 ! 2",
+)
+ENGINES = (
+    {"engine": "vm"},
+    {"optimisation_level": 2},
+    {"engine": "vm", "optimisation_level": 2},
+    {"lexer": "regex"},
+)
+TAIL_CALLS = 100000
+ROPES = 3000
+THREADS = 8
+
+
+def outcome(file_name: str, text: str, **options) -> tuple[str, str, str]:
+    output = StringIO()
+    try:
+        value, error = run(
+            file_name,
+            text,
+            environment=Environment.root.fork(output, StringIO()),
+            **options,
+        )
+    except Exception as e:
+        return output.getvalue(), None, e.__class__.__name__ + ": " + str(e)
+    return output.getvalue(), repr(value), error.as_string() if error else None
+
+
+def sources(file_names: list[str]) -> list[tuple[str, str]]:
+    texts = [(f"<snippet {i}>", snippet) for i, snippet in enumerate(SNIPPETS)]
+    programs = [os.path.join(DIRECTORY, name) for name in sorted(os.listdir(DIRECTORY))]
+    for file_name in programs + file_names:
+        with open(file_name, "r") as f:
+            texts.append((file_name, f.read()))
+    return texts
+
+
+def check_engines(texts: list[tuple[str, str]]) -> list[str]:
+    failures = []
+    for name, text in texts:
+        expected = outcome(name, text)
+        for options in ENGINES:
+            if outcome(name, text, **options) != expected:
+                failures.append(f"{name}: {options} differs from the interpreter")
+    return failures
+
+
+def check_tail_calls() -> list[str]:
+    failures = []
+    tail = (
+        "const count(n, total)\n"
+        "  if n == 0 then return total\n"
+        "  return count(n - 1, total + 1)\n"
+        "end\n"
+        f"print(count({TAIL_CALLS}, 0))"
+    )
+    deep = "const down(n) => if n == 0 then 0 else 1 + down(n - 1)\ndown(5000)"
+    for engine in ("interpreter", "vm"):
+        output, _, error = outcome("<tail>", tail, engine=engine)
+        if error or output != f"{TAIL_CALLS}\n":
+            failures.append(f"{engine}: tail calls failed ({output!r}, {error})")
+        _, _, error = outcome("<deep>", deep, engine=engine)
+        if not error or "Maximum call depth exceeded" not in error:
+            failures.append(f"{engine}: deep recursion did not hit the depth limit")
+    return failures
+
+
+def check_cache() -> list[str]:
+    failures = []
+    with TemporaryDirectory() as directory:
+        file_name = os.path.join(directory, "cached.arc")
+        with open(file_name, "w") as f:
+            f.write('auto xs = for i = 0 to 3 then i * i\nprint(xs)\nprint("done")\n')
+        cache = ProgramCache(os.path.join(directory, "cache"))
+        results = [execute(file_name, cache=cache) for _ in range(2)]
+        if results[0]["output"] != results[1]["output"] or results[0]["error"]:
+            failures.append(f"cached run differs: {results}")
+        key = cache.key(file_name, 0, False)
+        if cache.load(file_name, key) is None:
+            failures.append("program was not cached")
+        os.chmod(cache.path(file_name), 0o666)
+        if cache.load(file_name, key) is not None:
+            failures.append("a group/world-writable cache file was loaded")
+    return failures
+
+
+def check_module_cycle() -> list[str]:
+    with TemporaryDirectory() as directory:
+        first = os.path.join(directory, "first.arc")
+        second = os.path.join(directory, "second.arc")
+        with open(first, "w") as f:
+            f.write(f'print("first")\nrun("{second}")\n')
+        with open(second, "w") as f:
+            f.write(f'print("second")\nrun("{first}")\n')
+        result = execute(first)
+    if result["output"] != "first\nsecond\n":
+        return [f"entry file ran more than once: {result['output']!r}"]
+    if "Circular run" not in (result["error"] or ""):
+        return [f"cycle was not reported: {result['error']}"]
+    return []
+
+
+def check_fork_isolation() -> list[str]:
+    failures = []
+    parent = Environment.root.fork()
+    run("<parent>", "auto xs = [1, [2]]\nauto ys = xs", environment=parent)
+    first, second = parent.fork(), parent.fork()
+    run("<first>", "append(xs, 3)\nappend(xs / 1, 4)", environment=first)
+    for name, environment in (("parent", parent), ("sibling", second)):
+        if repr(environment.symbol_table.get("xs")) != "[1, [2]]":
+            failures.append(f"{name} saw a change made in another fork")
+    xs, ys = first.symbol_table.get("xs"), first.symbol_table.get("ys")
+    if xs is not ys or repr(ys) != "[1, [2, 4], 3]":
+        failures.append("aliasing inside a fork was not preserved")
+    return failures
+
+
+def check_ropes() -> list[str]:
+    random = Random(0)
+    strings = [(String("x" * 300), "x" * 300)]
+    for i in range(ROPES):
+        string, text = random.choice(strings[-20:])
+        piece = f"{i};" * random.randint(0, 20)
+        strings.append((string.added_to(String(piece))[0], text + piece))
+    failures = [
+        f"rope {i} differs" for i, (s, text) in enumerate(strings) if s.value != text
+    ]
+
+    shared = strings[-1][0]
+    errors = []
+
+    def extend(character: str) -> None:
+        for _ in range(ROPES // THREADS):
+            string = shared.added_to(String(character * 3))[0]
+            if (
+                string.added_to(String(character))[0].value
+                != shared.value + character * 4
+            ):
+                errors.append(character)
+
+    threads = [Thread(target=extend, args=(chr(97 + i),)) for i in range(THREADS)]
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+    if errors:
+        failures.append(f"{len(errors)} concurrent rope appends read another piece")
+    return failures
+
+
+def check_arrays() -> list[str]:
+    failures = []
+    text = (
+        "auto a = to_array([3, -1.5, 2, 0.25])\n"
+        "auto b = to_array([1, 2, 4, 8])\n"
+        "print([a + b, a - 1, a * b, a / b, a % 2, b ^ 2, a ^ 3, sort(a),"
+        " sum(a), min(a), max(a), mean(b), to_list(a), a / 2, to_array([10]) ^ 400])"
+    )
+    expected = (
+        "[array([4.0, 0.5, 6.0, 8.25]), array([2.0, -2.5, 1.0, -0.75]),"
+        " array([3.0, -3.0, 8.0, 2.0]), array([3.0, -0.75, 0.5, 0.03125]),"
+        " array([1.0, 0.5, 0.0, 0.25]), array([1.0, 4.0, 16.0, 64.0]),"
+        " array([27.0, -3.375, 8.0, 0.015625]), array([-1.5, 0.25, 2.0, 3.0]),"
+        " 3.75, -1.5, 3.0, 3.75, [3.0, -1.5, 2.0, 0.25], 2.0, array([inf])]\n"
+    )
+    previous = Array.numpy is not None
+    backends = [False] if Array.numpy is None else [False, True]
+    for is_numpy in backends:
+        Array.set_numpy(is_numpy)
+        try:
+            output, _, error = outcome("<arrays>", text)
+        finally:
+            Array.set_numpy(previous)
+        if error or output != expected:
+            backend = "numpy" if is_numpy else "array('d')"
+            failures.append(f"{backend}: {output or error}")
+    return failures
+
+
+CHECKS = {
+    "tail calls": check_tail_calls,
+    "cache": check_cache,
+    "module cycle": check_module_cycle,
+    "fork isolation": check_fork_isolation,
+    "ropes": check_ropes,
+    "arrays": check_arrays,
+}
+
+
+if __name__ == "__main__":
+    sys.setrecursionlimit(100000)
+    checks = {"engines": partial(check_engines, sources(sys.argv[1:])), **CHECKS}
+    failed = 0
+    for name, check in checks.items():
+        failures = check()
+        failed += bool(failures)
+        print(f"{name:<16} {'FAILED' if failures else 'ok'}")
+        for failure in failures:
+            print(f"    {failure}")
+    exit(1 if failed else 0)
@@ -0,0 +1,92 @@
+from timeit import repeat
+from srcs.lexer import Lexer
+from srcs.parser import Parser
+from srcs.interpreter import Interpreter
+from srcs.base.context import Context
+from srcs.base.symbol_table import SymbolTable
+from srcs.base.number import Number
+from srcs.base.value import Value
+from srcs.base.run_time_result import RunTimeResult
+from srcs.base.functions.builtin_function import BuiltInFunction
+
+EXPRESSION = "(1 + 2) * 3 - 4 / 5 + 6 % 7 - 8 ^ 2"
+NODE_COUNT = 17
+NUMBER = 20000
+REPEAT = 5
+
+
+class GetattrInterpreter(Interpreter):
+    def evaluate(self, node, context: "Context") -> "Value":
+        method_name = f"visit_{type(node).__name__}"
+        method = getattr(self, method_name, self.no_visit_method)
+        return method(node, context)
+
+
+class GetattrBuiltInFunction(BuiltInFunction):
+    def execute(self, arguments) -> "RunTimeResult":
+        response = RunTimeResult()
+        context = self.generate_new_context()
+
+        method = getattr(self, f"execute_{self.name}")
+
+        response.register(
+            self.check_and_populate_arguments(method.argument_names, arguments, context)
+        )
+        if response.should_return():
+            return response
+
+        return_value = response.register(method(context))
+        if response.should_return():
+            return response
+
+        return response.success(return_value)
+
+
+def parse(text: str):
+    tokens, _ = Lexer("<benchmark>", text).make_tokens()
+    return Parser(tokens).parse().node.element_nodes[0]
+
+
+def best(statement) -> float:
+    return min(repeat(statement, number=NUMBER, repeat=REPEAT)) / NUMBER
+
+
+def benchmark_visit() -> None:
+    node = parse(EXPRESSION)
+    context = Context("<benchmark>")
+    context.symbol_table = SymbolTable()
+    getattr_interpreter = GetattrInterpreter()
+    table_interpreter = Interpreter()
+
+    before = best(lambda: getattr_interpreter.visit(node, context)) / NODE_COUNT
+    after = best(lambda: table_interpreter.visit(node, context)) / NODE_COUNT
+    report("Interpreter.visit (per node)", before, after)
+
+    node = parse("continue")
+    before = best(lambda: getattr_interpreter.visit(node, context))
+    after = best(lambda: table_interpreter.visit(node, context))
+    report("Interpreter.visit (ContinueNode)", before, after)
+
+
+def benchmark_builtin() -> None:
+    context = Context("<benchmark>")
+    context.symbol_table = SymbolTable()
+    arguments = [Number(1)]
+    getattr_builtin = GetattrBuiltInFunction("is_number").set_context(context)
+    table_builtin = BuiltInFunction("is_number").set_context(context)
+
+    before = best(lambda: getattr_builtin.execute(arguments))
+    after = best(lambda: table_builtin.execute(arguments))
+    report("BuiltInFunction.execute (per call)", before, after)
+
+
+def report(name: str, before: float, after: float) -> None:
+    print(
+        f"{name:<36} getattr {before * 1e9:8.1f} ns"
+        f"   table {after * 1e9:8.1f} ns   speedup {before / after:.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    benchmark_visit()
+    benchmark_builtin()
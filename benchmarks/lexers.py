@@ -0,0 +1,128 @@
+import sys
+from random import Random
+from timeit import repeat
+from srcs.lexer import Lexer
+from srcs.regex_lexer import RegexLexer
+from benchmarks.parse_memory import generate
+
+SNIPPETS = (
+    "",
+    "auto x = 1.5.2",
+    "auto y = 12. + .5",
+    'print("tab\\tquote\\"end")',
+    '"unterminated',
+    '"',
+    "a_1 = b__ ==c=>d<=e>=f!=g<h>i",
+    "# comment only",
+    "x = 1 # trailing; y = 2\nz",
+    "if a then\n\tb\r\nend",
+    "a ! b",
+    "a !",
+    "value $ 1",
+    "_name",
+    "\n\n;;\n",
+)
+ALPHABET = 'abz019_ .\t\n;#"\\+-*/%^()[],=<>!$'
+FUZZ_CASES = 2000
+TRICKLE_SIZES = (1, 2, 3, 7)
+NUMBER = 5
+REPEAT = 3
+
+
+class Trickle:
+    def __init__(self, text: str, size: int) -> None:
+        self.text = text
+        self.size = size
+        self.index = 0
+
+    def read(self, size: int = -1) -> str:
+        chunk = self.text[self.index : self.index + self.size]
+        self.index += len(chunk)
+        return chunk
+
+
+def streamed(lexer_class: type, size: int):
+    return lambda file_name, text: lexer_class(file_name, stream=Trickle(text, size))
+
+
+def describe_position(position) -> tuple:
+    return position.index, position.line, position.column
+
+
+def describe(lexer_class: type, text: str) -> tuple:
+    tokens, error = lexer_class("<corpus>", text).make_tokens()
+    if error:
+        return (
+            type(error).__name__,
+            error.details,
+            describe_position(error.position_start),
+            describe_position(error.position_end),
+        )
+    return [
+        (
+            token.type,
+            token.value,
+            type(token.value),
+            describe_position(token.position_start),
+            describe_position(token.position_end),
+        )
+        for token in tokens
+    ]
+
+
+def corpus(file_names: list[str]) -> list[tuple[str, str]]:
+    texts = [(f"snippet {i}", snippet) for i, snippet in enumerate(SNIPPETS)]
+    texts.append(("generated", generate(200)))
+    random = Random(0)
+    for i in range(FUZZ_CASES):
+        texts.append(
+            (
+                f"fuzz {i}",
+                "".join(random.choice(ALPHABET) for _ in range(random.randint(0, 40))),
+            )
+        )
+    for file_name in file_names:
+        with open(file_name, "r") as f:
+            texts.append((file_name, f.read()))
+    return texts
+
+
+def compare(texts: list[tuple[str, str]]) -> int:
+    mismatches = 0
+    for name, text in texts:
+        expected = describe(Lexer, text)
+        for lexer_class in (
+            RegexLexer,
+            *(
+                streamed(streamed_class, size)
+                for streamed_class in (Lexer, RegexLexer)
+                for size in TRICKLE_SIZES
+            ),
+        ):
+            if describe(lexer_class, text) != expected:
+                mismatches += 1
+                print(f"mismatch in {name}: {text!r}")
+                break
+    return mismatches
+
+
+def benchmark(text: str) -> None:
+    for lexer_class in (Lexer, RegexLexer):
+        best = min(
+            repeat(
+                lambda: lexer_class("<benchmark>", text).make_tokens(),
+                number=NUMBER,
+                repeat=REPEAT,
+            )
+        )
+        print(
+            f"{lexer_class.__name__:<12} {len(text) / 1024 / (best / NUMBER):10.1f} KiB/s"
+        )
+
+
+if __name__ == "__main__":
+    texts = corpus(sys.argv[1:] or ["main.arc"])
+    mismatches = compare(texts)
+    print(f"{len(texts)} sources, {mismatches} mismatches")
+    benchmark(generate(500))
+    exit(1 if mismatches else 0)
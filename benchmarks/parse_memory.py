@@ -0,0 +1,57 @@
+import tracemalloc
+from io import StringIO
+from srcs.lexer import Lexer
+from srcs.regex_lexer import RegexLexer
+from srcs.parser import Parser
+
+LINES = (
+    "auto total{i} = {i} * 2 + (3 - {i}) / 4",
+    "const add{i}(a, b) => a + b * {i}",
+    "for j = 0 to {i} then auto total{i} = total{i} + add{i}(j, 1)",
+    'if total{i} > {i} then print("large {i}") elif total{i} == 0 then print("zero") else print("small")',
+    'auto items{i} = [{i}, "{i}", [1, 2, 3], not 0]',
+)
+FUNCTIONS = 2000
+
+
+def generate(functions: int) -> str:
+    return "\n".join(line.format(i=i) for i in range(functions) for line in LINES)
+
+
+def measure(text: str) -> tuple:
+    tracemalloc.start()
+    tokens, error = Lexer("<benchmark>", text).make_tokens()
+    if error:
+        raise Exception(error.as_string())
+    after_lexing = tracemalloc.get_traced_memory()[0]
+    result = Parser(tokens).parse()
+    if result.error:
+        raise Exception(result.error.as_string())
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(tokens), after_lexing, retained, peak
+
+
+def measure_streaming(text: str) -> tuple:
+    stream = StringIO(text)
+    tracemalloc.start()
+    lexer = RegexLexer("<benchmark>", stream=stream)
+    result = Parser(lexer.generate_tokens()).parse()
+    if lexer.error or result.error:
+        raise Exception((lexer.error or result.error).as_string())
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return retained, peak
+
+
+if __name__ == "__main__":
+    text = generate(FUNCTIONS)
+    count, tokens, retained, peak = measure(text)
+    print(f"source      {len(text) / 1024:10.1f} KiB, {count} tokens")
+    print(f"tokens      {tokens / 1024:10.1f} KiB ({tokens / count:.1f} B/token)")
+    print(f"tokens+ast  {retained / 1024:10.1f} KiB")
+    print(f"peak        {peak / 1024:10.1f} KiB")
+    retained, peak = measure_streaming(text)
+    print(
+        f"streamed    {retained / 1024:10.1f} KiB retained, {peak / 1024:.1f} KiB peak"
+    )
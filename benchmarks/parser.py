@@ -0,0 +1,58 @@
+from sys import setrecursionlimit
+from timeit import repeat
+from srcs.lexer import Lexer
+from srcs.parser import Parser
+
+BLOCK = """const f{i}(a)
+    for j = 0 to a then
+        if j > {i} then
+            return j
+        elif j == 0 then
+            continue
+        else
+            auto a = a - 1
+        end
+        while a > 0 then auto a = a - 1
+    end
+    return
+end"""
+NESTED = """if x > {i} then
+    auto x = x - 1
+{body}
+    for j = 0 to x then print(j)
+else
+    break
+end"""
+SIZES = (250, 500, 1000, 2000, 4000)
+DEPTHS = (25, 50, 100, 200, 400)
+REPEAT = 3
+
+
+def flat(size: int) -> str:
+    return "\n".join(BLOCK.format(i=i) for i in range(size))
+
+
+def nested(depth: int) -> str:
+    body = "    print(x)"
+    for i in range(depth):
+        body = NESTED.format(i=i, body=body)
+    return body
+
+
+def benchmark(name: str, generate, sizes: tuple) -> None:
+    print(name)
+    for size in sizes:
+        tokens, error = Lexer("<benchmark>", generate(size)).make_tokens()
+        if error:
+            raise Exception(error.as_string())
+        best = min(repeat(lambda: Parser(tokens).parse(), number=1, repeat=REPEAT))
+        print(
+            f"  {size:>6} {len(tokens):>8} tokens {best * 1000:9.1f} ms"
+            f" {best / len(tokens) * 1e6:7.2f} us/token"
+        )
+
+
+if __name__ == "__main__":
+    setrecursionlimit(100000)
+    benchmark("sequential functions", flat, SIZES)
+    benchmark("nested if/for bodies", nested, DEPTHS)
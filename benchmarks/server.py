@@ -0,0 +1,69 @@
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+from time import perf_counter, sleep
+from benchmarks.parse_memory import generate
+
+SIZES = (10, 50, 200)
+REPEAT = 3
+
+
+def cold(file_name: str) -> float:
+    start = perf_counter()
+    subprocess.run(
+        [sys.executable, "main.py", "--no-cache", file_name],
+        stdout=subprocess.DEVNULL,
+        check=True,
+    )
+    return perf_counter() - start
+
+
+def warm(stream, file_name: str) -> float:
+    start = perf_counter()
+    stream.write(json.dumps({"file_name": file_name}).encode() + b"\n")
+    stream.flush()
+    response = json.loads(stream.readline())
+    if response["error"]:
+        raise Exception(response["error"])
+    return perf_counter() - start
+
+
+def connect(path: str) -> "socket.socket":
+    for _ in range(100):
+        try:
+            connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            connection.connect(path)
+            return connection
+        except (FileNotFoundError, ConnectionRefusedError):
+            connection.close()
+            sleep(0.05)
+    raise Exception(f"Server did not start on {path}")
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "arcane.sock")
+        server = subprocess.Popen(
+            [sys.executable, "main.py", "--serve", path, "--cache-dir", directory]
+        )
+        try:
+            with connect(path) as connection:
+                stream = connection.makefile("rwb")
+                print(f"{'functions':>10} {'cold':>10} {'warm':>10} {'speedup':>8}")
+                for size in SIZES:
+                    file_name = os.path.join(directory, f"program_{size}.arc")
+                    with open(file_name, "w") as f:
+                        f.write(generate(size))
+                    cold_time = min(cold(file_name) for _ in range(REPEAT))
+                    warm(stream, file_name)
+                    warm_time = min(warm(stream, file_name) for _ in range(REPEAT))
+                    print(
+                        f"{size:>10} {cold_time * 1000:8.1f}ms {warm_time * 1000:8.1f}ms"
+                        f" {cold_time / warm_time:7.1f}x"
+                    )
+        finally:
+            server.terminate()
+            server.wait()
@@ -0,0 +1,210 @@
+import gc
+import json
+import os
+import sys
+import tracemalloc
+from argparse import ArgumentParser
+from io import StringIO
+from itertools import combinations
+from random import Random
+from statistics import mean, median
+from time import perf_counter
+from srcs.lexer import Lexer
+from srcs.parser import Parser
+from srcs.resolver import Resolver
+from srcs.optimizer import Optimizer
+from srcs.program import Program
+from srcs.environment import Environment
+from srcs.base.constants.version import VERSION
+from benchmarks.checks import check_engines
+
+DIRECTORY = os.path.join(os.path.dirname(__file__), "programs")
+WORKLOADS = {
+    "fib": 8361,
+    "loops": 30000,
+    "strjoin": 2000,
+    "map_append": 10000,
+    "nested_if": 5000,
+    "builtins": 25000,
+}
+PHASES = ("lex", "parse", "execute")
+REPEAT = 5
+SIGNIFICANCE = 0.05
+THRESHOLD = 0.05
+PERMUTATIONS = 10000
+
+
+def measure(name: str, engine: str, optimisation_level: int) -> dict[str, float]:
+    file_name = os.path.join(DIRECTORY, name + ".arc")
+    with open(file_name, "r") as f:
+        text = f.read()
+
+    start = perf_counter()
+    tokens, error = Lexer(file_name, text).make_tokens()
+    if error:
+        raise Exception(error.as_string())
+    lexed = perf_counter()
+    ast = Parser(tokens).parse()
+    if ast.error:
+        raise Exception(ast.error.as_string())
+    resolver = Resolver()
+    node = resolver.resolve(ast.node, is_used=False)
+    optimizer = Optimizer(
+        optimisation_level, Environment.root.symbol_table, resolver.declared_names
+    )
+    program = Program(
+        file_name,
+        optimizer.optimize(node),
+        optimizer.report,
+        resolver.bound_names,
+        resolver.global_names,
+    )
+    parsed = perf_counter()
+    _, error = program.execute(Environment.root.fork(StringIO()), engine=engine)
+    if error:
+        raise Exception(error.as_string())
+    executed = perf_counter()
+    return {"lex": lexed - start, "parse": parsed - lexed, "execute": executed - parsed}
+
+
+def peak_memory(name: str, engine: str, optimisation_level: int) -> int:
+    tracemalloc.start()
+    try:
+        measure(name, engine, optimisation_level)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_suite(names: list[str], engine: str, optimisation_level: int, repeat: int):
+    results = {}
+    for name in names:
+        samples = {phase: [] for phase in PHASES}
+        measure(name, engine, optimisation_level)
+        for _ in range(repeat):
+            gc.collect()
+            for phase, elapsed in measure(name, engine, optimisation_level).items():
+                samples[phase].append(elapsed)
+        results[name] = {
+            "ops": WORKLOADS[name],
+            "samples": samples,
+            "peak_memory": peak_memory(name, engine, optimisation_level),
+        }
+    return {
+        "version": VERSION,
+        "python": sys.version.split()[0],
+        "engine": engine,
+        "optimisation_level": optimisation_level,
+        "results": results,
+    }
+
+
+def check(names: list[str]) -> int:
+    texts = []
+    for name in names:
+        with open(os.path.join(DIRECTORY, name + ".arc"), "r") as f:
+            texts.append((name, f.read()))
+    failures = check_engines(texts)
+    for failure in failures:
+        print(f"MISMATCH {failure}")
+    return len(failures)
+
+
+def print_results(suite: dict) -> None:
+    print(
+        f"{'workload':<12} {'lex ms':>8} {'parse ms':>9} {'exec ms':>9}"
+        f" {'ops/sec':>10} {'peak KiB':>9}"
+    )
+    for name, result in suite["results"].items():
+        times = {phase: median(result["samples"][phase]) for phase in PHASES}
+        print(
+            f"{name:<12} {times['lex'] * 1000:>8.2f} {times['parse'] * 1000:>9.2f}"
+            f" {times['execute'] * 1000:>9.1f} {result['ops'] / times['execute']:>10.0f}"
+            f" {result['peak_memory'] / 1024:>9.0f}"
+        )
+
+
+def p_value(baseline: list[float], current: list[float]) -> float:
+    samples = baseline + current
+    observed = mean(current) - mean(baseline)
+    size = len(current)
+    total = sum(samples)
+    if len(samples) <= 20:
+        splits = [
+            sum(samples[i] for i in indexes)
+            for indexes in combinations(range(len(samples)), size)
+        ]
+    else:
+        random = Random(0)
+        splits = [sum(random.sample(samples, size)) for _ in range(PERMUTATIONS)]
+    differences = [
+        split / size - (total - split) / (len(samples) - size) for split in splits
+    ]
+    return sum(difference >= observed for difference in differences) / len(differences)
+
+
+def compare(baseline: dict, current: dict, threshold: float = THRESHOLD) -> int:
+    regressions = 0
+    print(f"{'workload':<12} {'phase':<8} {'change':>8} {'p':>7}")
+    for name, result in current["results"].items():
+        if name not in baseline["results"]:
+            continue
+        for phase in PHASES:
+            before = baseline["results"][name]["samples"][phase]
+            after = result["samples"][phase]
+            change = median(after) / median(before) - 1
+            p = p_value(before, after)
+            is_regression = p < SIGNIFICANCE and change > threshold
+            regressions += is_regression
+            print(
+                f"{name:<12} {phase:<8} {change * 100:>+7.1f}% {p:>7.3f}"
+                + ("  REGRESSION" if is_regression else "")
+            )
+    return regressions
+
+
+def load(file_name: str) -> dict:
+    with open(file_name, "r") as f:
+        return json.load(f)
+
+
+if __name__ == "__main__":
+    argument_parser = ArgumentParser(prog="benchmarks.suite")
+    argument_parser.add_argument("workloads", nargs="*", metavar="WORKLOAD")
+    argument_parser.add_argument(
+        "--engine", choices=("interpreter", "vm"), default="interpreter"
+    )
+    argument_parser.add_argument(
+        "-O", dest="optimisation_level", type=int, default=0, metavar="LEVEL"
+    )
+    argument_parser.add_argument("--repeat", type=int, default=REPEAT)
+    argument_parser.add_argument("--save", metavar="FILE")
+    argument_parser.add_argument("--baseline", metavar="FILE")
+    argument_parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CURRENT"))
+    argument_parser.add_argument("--threshold", type=float, default=THRESHOLD)
+    options = argument_parser.parse_args()
+    for name in options.workloads:
+        if name not in WORKLOADS:
+            argument_parser.error(f"unknown workload '{name}'")
+    sys.setrecursionlimit(100000)
+
+    if options.compare:
+        baseline, current = map(load, options.compare)
+        exit(1 if compare(baseline, current, options.threshold) else 0)
+
+    names = options.workloads or list(WORKLOADS)
+    if check(names):
+        exit(1)
+    current = run_suite(
+        names,
+        options.engine,
+        options.optimisation_level,
+        options.repeat,
+    )
+    print_results(current)
+    if options.save:
+        with open(options.save, "w") as f:
+            json.dump(current, f, indent=2)
+    if options.baseline:
+        print()
+        exit(1 if compare(load(options.baseline), current, options.threshold) else 0)
@@ -0,0 +1,42 @@
+import json
+import os
+import socket
+from argparse import ArgumentParser
+
+if __name__ == "__main__":
+    argument_parser = ArgumentParser(prog="arcane-client")
+    argument_parser.add_argument("socket")
+    argument_parser.add_argument("files", nargs="+")
+    argument_parser.add_argument(
+        "-O", dest="optimisation_level", type=int, default=0, metavar="LEVEL"
+    )
+    argument_parser.add_argument("--report", action="store_true")
+    argument_parser.add_argument("--engine", choices=("interpreter", "vm"))
+    argument_parser.add_argument("--lexer", choices=("character", "regex"))
+    argument_parser.add_argument("--max-depth", dest="max_call_depth", type=int)
+    argument_parser.add_argument("--time", action="store_true")
+    options = argument_parser.parse_args()
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(options.socket)
+        stream = connection.makefile("rwb")
+        for file_name in options.files:
+            request = {
+                "file_name": file_name,
+                "cwd": os.getcwd(),
+                "optimisation_level": options.optimisation_level,
+                "report": options.report,
+            }
+            for name in ("engine", "lexer", "max_call_depth"):
+                if getattr(options, name) is not None:
+                    request[name] = getattr(options, name)
+            stream.write(json.dumps(request).encode() + b"\n")
+            stream.flush()
+            response = json.loads(stream.readline())
+            if response.get("report"):
+                print("\n".join(response["report"]))
+            print(response["output"], end="")
+            if response["error"]:
+                print(response["error"])
+            if options.time:
+                print(f"{file_name}: {response['time'] * 1000:.2f} ms")
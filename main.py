@@ -1,17 +1,153 @@
-from srcs.shell import run
-from sys import argv
+from srcs.shell import run, execute
+from srcs.base.constants.limits import MAX_CALL_DEPTH
+from srcs.base.number import Number
+from srcs.base.constants.version import VERSION
+from srcs.program_cache import ProgramCache
+from srcs.environment import Environment
+from srcs.profiler import Profiler
+from srcs.server import Server
+from argparse import ArgumentParser
+from atexit import register
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import partial
+from os import cpu_count
+from signal import signal, SIGTERM, default_int_handler
+from sys import stdin, stderr
+from time import perf_counter
+
+
+def configure(options) -> None:
+    if not options.no_cache:
+        ProgramCache.set_default(
+            ProgramCache(options.cache_dir, in_memory=bool(options.serve))
+        )
+    if options.no_number_cache:
+        Number.set_cache(False)
+
+
+def write_profile(profiler: "Profiler", flamegraph: str = None) -> None:
+    print(profiler.report(), file=stderr)
+    if flamegraph:
+        with open(flamegraph, "w") as f:
+            f.write(profiler.collapsed() + "\n")
+
 
 if __name__ == "__main__":
-    if len(argv) > 1:
-        for i in range(1, len(argv)):
-            with open(argv[i], "r") as f:
-                content = f.read()
+    argument_parser = ArgumentParser(prog="arcane")
+    argument_parser.add_argument("files", nargs="*")
+    argument_parser.add_argument(
+        "-O", dest="optimisation_level", type=int, default=0, metavar="LEVEL"
+    )
+    argument_parser.add_argument(
+        "--engine", choices=("interpreter", "vm"), default="interpreter"
+    )
+    argument_parser.add_argument("--report", action="store_true")
+    argument_parser.add_argument(
+        "--max-depth", dest="max_call_depth", type=int, default=MAX_CALL_DEPTH
+    )
+    argument_parser.add_argument("--no-number-cache", action="store_true")
+    argument_parser.add_argument(
+        "--lexer", choices=("character", "regex"), default="character"
+    )
+    argument_parser.add_argument("--cache-dir", metavar="DIRECTORY")
+    argument_parser.add_argument("--no-cache", action="store_true")
+    argument_parser.add_argument("--serve", metavar="SOCKET")
+    argument_parser.add_argument("-j", "--jobs", type=int, metavar="N")
+    argument_parser.add_argument("--profile", action="store_true")
+    argument_parser.add_argument("--flamegraph", metavar="FILE")
+    argument_parser.add_argument("--version", action="version", version=VERSION)
+    options = argument_parser.parse_args()
+    if options.jobs is not None and (options.profile or options.flamegraph):
+        argument_parser.error("--profile and --flamegraph cannot be used with --jobs")
+    configure(options)
+    report = [] if options.report else None
+    environment = Environment.root.fork()
+    profiler = Profiler() if options.profile or options.flamegraph else None
+    if profiler:
+        register(write_profile, profiler, options.flamegraph)
+
+    if options.serve:
+        signal(SIGTERM, default_int_handler)
+        try:
+            server = Server(options.serve)
+        except Exception as e:
+            print(e.__class__.__name__ + ": " + str(e), file=stderr)
+            exit(1)
+        with server:
             try:
-                result, error = run(argv[i], content)
-                if error:
-                    print(error.as_string())
-            except Exception as e:
-                print(e.__class__.__name__ + ": " + str(e))
+                server.serve_forever()
+            except KeyboardInterrupt:
+                exit(0)
+
+    if options.files and options.jobs is not None:
+        workers = options.jobs or cpu_count()
+        file_names = ["<stdin>" if name == "-" else name for name in options.files]
+        texts = [stdin.read() if name == "-" else None for name in options.files]
+        job = partial(
+            execute,
+            report=options.report,
+            engine=options.engine,
+            optimisation_level=options.optimisation_level,
+            max_call_depth=options.max_call_depth,
+            lexer=options.lexer,
+        )
+        errors = 0
+        start = perf_counter()
+        with ProcessPoolExecutor(
+            workers, initializer=configure, initargs=(options,)
+        ) as pool:
+            results = pool.map(
+                job,
+                file_names,
+                texts,
+                chunksize=max(1, len(file_names) // (workers * 4)),
+            )
+            for file_name, result in zip(file_names, results):
+                if result["report"]:
+                    print("\n".join(result["report"]))
+                print(result["output"], end="")
+                if result["error"]:
+                    print(result["error"])
+                    errors += 1
+                print(
+                    f"{file_name}: {result['time'] * 1000:.2f} ms"
+                    + (" (error)" if result["error"] else ""),
+                    file=stderr,
+                )
+        print(
+            f"{len(file_names)} files, {errors} errors,"
+            f" {perf_counter() - start:.2f} s with {workers} jobs",
+            file=stderr,
+        )
+        exit(0)
+
+    if options.files:
+        for file_name in options.files:
+            with open(file_name, "r") if file_name != "-" else nullcontext(stdin) as f:
+                environment.modules.begin(file_name)
+                try:
+                    result, error = run(
+                        "<stdin>" if file_name == "-" else file_name,
+                        engine=options.engine,
+                        optimisation_level=options.optimisation_level,
+                        report=report,
+                        max_call_depth=options.max_call_depth,
+                        lexer=options.lexer,
+                        stream=f,
+                        environment=environment,
+                        profiler=profiler,
+                        is_used=False,
+                    )
+                    if report:
+                        print("\n".join(report))
+                        report.clear()
+                    if error:
+                        print(error.as_string())
+                except Exception as e:
+                    print(e.__class__.__name__ + ": " + str(e))
+                finally:
+                    environment.modules.end()
         exit(0)
     try:
         while True:
@@ -21,7 +157,21 @@ if __name__ == "__main__":
             elif line == "exit":
                 print("Bye!"), exit(0)
             try:
-                result, error = run("<stdin>", line)
+                result, error = run(
+                    "<stdin>",
+                    line,
+                    engine=options.engine,
+                    optimisation_level=options.optimisation_level,
+                    report=report,
+                    max_call_depth=options.max_call_depth,
+                    lexer=options.lexer,
+                    environment=environment,
+                    profiler=profiler,
+                    is_used=False,
+                )
+                if report:
+                    print("\n".join(report))
+                    report.clear()
                 if error:
                     print(error.as_string())
             except Exception as e:
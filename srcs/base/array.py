@@ -0,0 +1,177 @@
+import operator
+from array import array
+from math import fsum, inf
+from typing import Callable, Sequence
+from .value import Value
+from .number import Number
+from ..errors.run_time_error import RunTimeError
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class Array(Value):
+    numpy = numpy
+
+    def __init__(self, values) -> None:
+        super().__init__()
+        self.values = values
+
+    @classmethod
+    def set_numpy(cls, enabled: bool) -> None:
+        cls.numpy = numpy if enabled else None
+
+    @staticmethod
+    def of(values: Sequence[float]) -> "Array":
+        if Array.numpy is not None:
+            return Array(Array.numpy.asarray(values, dtype=Array.numpy.float64))
+        return Array(array("d", values))
+
+    @staticmethod
+    def backing_types() -> tuple[type, ...]:
+        if Array.numpy is None:
+            return (array,)
+        return (array, Array.numpy.ndarray)
+
+    @staticmethod
+    def power(base: float, exponent: float) -> float:
+        try:
+            return base**exponent
+        except OverflowError:
+            return -inf if base < 0 and exponent % 2 == 1 else inf
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __repr__(self) -> str:
+        return f"array([{', '.join([repr(float(value)) for value in self.values])}])"
+
+    def copy(self) -> "Array":
+        return (
+            Array(self.values)
+            .set_context(self.context)
+            .set_position(self.position_start, self.position_end)
+        )
+
+    def is_true(self) -> bool:
+        return len(self.values) > 0
+
+    def to_list(self) -> list[float]:
+        return [float(value) for value in self.values]
+
+    def total(self) -> float:
+        if isinstance(self.values, array):
+            return fsum(self.values)
+        return float(self.values.sum())
+
+    def minimum(self) -> float:
+        if isinstance(self.values, array):
+            return min(self.values)
+        return float(self.values.min())
+
+    def maximum(self) -> float:
+        if isinstance(self.values, array):
+            return max(self.values)
+        return float(self.values.max())
+
+    def mean(self) -> float:
+        return self.total() / len(self.values)
+
+    def sorted(self) -> "Array":
+        if Array.numpy is None or isinstance(self.values, array):
+            return Array(array("d", sorted(self.values)))
+        return Array(Array.numpy.sort(self.values))
+
+    def combine(
+        self, other: "Value", operation: "Callable"
+    ) -> tuple["Array", "RunTimeError"]:
+        if isinstance(other, Number):
+            right = other.value
+        elif isinstance(other, Array):
+            if len(other.values) != len(self.values):
+                return None, RunTimeError(
+                    other.position_start,
+                    other.position_end,
+                    "Arrays must have the same length",
+                    self.context,
+                )
+            right = other.values
+        else:
+            return None, Value.illegal_operation(self, other)
+
+        left = self.values
+        is_numpy = Array.numpy is not None and not isinstance(left, array)
+        if not is_numpy:
+            if not isinstance(left, array):
+                left = array("d", left)
+            if isinstance(other, Array) and not isinstance(right, array):
+                right = array("d", right)
+        try:
+            if is_numpy:
+                if isinstance(right, array):
+                    right = Array.numpy.asarray(right)
+                with Array.numpy.errstate(
+                    divide="raise", invalid="raise", over="ignore"
+                ):
+                    values = operation(left, right)
+            elif isinstance(other, Number):
+                values = array("d", [operation(value, right) for value in left])
+            else:
+                values = array("d", map(operation, left, right))
+        except (ZeroDivisionError, FloatingPointError) as e:
+            is_division = (
+                isinstance(e, ZeroDivisionError)
+                or "divide" in str(e)
+                or operation is operator.mod
+            )
+            return None, RunTimeError(
+                other.position_start,
+                other.position_end,
+                "Division by zero" if is_division else "Invalid arithmetic operation",
+                self.context,
+            )
+        except (TypeError, OverflowError):
+            return None, RunTimeError(
+                other.position_start,
+                other.position_end,
+                "Invalid arithmetic operation",
+                self.context,
+            )
+        return Array(values).set_context(self.context), None
+
+    def added_to(self, other: "Value") -> tuple["Value", "RunTimeError"]:
+        return self.combine(other, operator.add)
+
+    def subtracted_by(self, other: "Value") -> tuple["Value", "RunTimeError"]:
+        return self.combine(other, operator.sub)
+
+    def multiplied_by(self, other: "Value") -> tuple["Value", "RunTimeError"]:
+        return self.combine(other, operator.mul)
+
+    def divided_by(self, other: "Value") -> tuple["Value", "RunTimeError"]:
+        if isinstance(other, Array):
+            return self.combine(other, operator.truediv)
+        if isinstance(other, Number) and type(other.value) is int:
+            try:
+                return Number.of(float(self.values[other.value])), None
+            except IndexError:
+                return None, RunTimeError(
+                    other.position_start,
+                    other.position_end,
+                    "Index out of bounds",
+                    self.context,
+                )
+        return None, RunTimeError(
+            other.position_start,
+            other.position_end,
+            "Cannot divide array by non-array; index must be an integer",
+            self.context,
+        )
+
+    def moduled_by(self, other: "Value") -> tuple["Value", "RunTimeError"]:
+        return self.combine(other, operator.mod)
+
+    def powered_by(self, other: "Value") -> tuple["Value", "RunTimeError"]:
+        return self.combine(other, Array.power)
@@ -0,0 +1,57 @@
+from array import array
+from .position import Position
+
+
+class Code:
+    def __init__(
+        self,
+        name: str,
+        argument_names: list[str] = None,
+        is_automatic_return: bool = False,
+        layout: dict[str, int] = None,
+    ) -> None:
+        self.name = name
+        self.argument_names = argument_names or []
+        self.is_automatic_return = is_automatic_return
+        self.layout = layout
+        self.local_names = list(layout) if layout else []
+        self.instructions = array("i")
+        self.constants = []
+        self.names = []
+        self.name_indexes = {}
+        self.positions = {}
+
+    def __repr__(self) -> str:
+        return f"<code {self.name}>"
+
+    def emit(
+        self,
+        opcode: int,
+        argument: int = 0,
+        position_start: "Position" = None,
+        position_end: "Position" = None,
+    ) -> int:
+        offset = len(self.instructions)
+        self.instructions.append(opcode)
+        self.instructions.append(argument)
+        if position_start:
+            self.positions[offset] = (position_start, position_end)
+        return offset
+
+    def patch(self, offset: int, argument: int) -> None:
+        self.instructions[offset + 1] = argument
+
+    def offset(self) -> int:
+        return len(self.instructions)
+
+    def add_constant(self, value: any) -> int:
+        self.constants.append(value)
+        return len(self.constants) - 1
+
+    def add_name(self, name: str) -> int:
+        index = self.name_indexes.get(name)
+        if index is None:
+            index = len(self.names)
+            self.names.append(name)
+            self.name_indexes[name] = index
+        return index
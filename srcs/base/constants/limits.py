@@ -0,0 +1,5 @@
+MAX_CALL_DEPTH      = 1000
+FRAMES_PER_CALL     = 64
+NUMBER_CACHE_MIN    = -128
+NUMBER_CACHE_MAX    = 1024
+CHUNK_SIZE          = 1 << 16
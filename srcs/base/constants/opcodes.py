@@ -0,0 +1,62 @@
+OP_ADD                  = 0
+OP_SUBTRACT             = 1
+OP_MULTIPLY             = 2
+OP_DIVIDE               = 3
+OP_MODULO               = 4
+OP_POWER                = 5
+OP_EQ                   = 6
+OP_NEQ                  = 7
+OP_LT                   = 8
+OP_LTE                  = 9
+OP_GT                   = 10
+OP_GTE                  = 11
+OP_AND                  = 12
+OP_OR                   = 13
+
+OP_LOAD_CONST           = 14
+OP_LOAD_NAME            = 15
+OP_LOAD_LOCAL           = 16
+OP_LOAD_GLOBAL          = 17
+OP_STORE_NAME           = 18
+OP_STORE_LOCAL          = 19
+OP_DUPLICATE            = 20
+OP_POP                  = 21
+
+OP_NEGATE               = 22
+OP_NOT                  = 23
+
+OP_JUMP                 = 24
+OP_POP_JUMP_IF_FALSE    = 25
+
+OP_BUILD_LIST           = 26
+OP_LIST_APPEND          = 27
+
+OP_SETUP_LOOP           = 28
+OP_POP_BLOCK            = 29
+OP_BREAK_LOOP           = 30
+OP_CONTINUE_LOOP        = 31
+OP_FOR_PREPARE          = 32
+OP_FOR_ITERATE          = 33
+
+OP_MAKE_FUNCTION        = 34
+OP_CALL                 = 35
+OP_RETURN_VALUE         = 36
+OP_HALT                 = 37
+OP_TAIL_CALL            = 38
+
+BINARY_OPERATIONS       = (
+    "added_to",
+    "subtracted_by",
+    "multiplied_by",
+    "divided_by",
+    "moduled_by",
+    "powered_by",
+    "get_comparison_eq",
+    "get_comparison_neq",
+    "get_comparison_lt",
+    "get_comparison_lte",
+    "get_comparison_gt",
+    "get_comparison_gte",
+    "anded_by",
+    "ored_by",
+)
@@ -0,0 +1,2 @@
+DEPTH_LOCAL         = 0
+DEPTH_GLOBAL        = -1
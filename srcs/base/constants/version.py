@@ -0,0 +1,3 @@
+VERSION             = "1.2.1"
+CACHE_DIRECTORY     = "__arccache__"
+CACHE_EXTENSION     = ".arcc"
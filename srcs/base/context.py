@@ -4,8 +4,14 @@ class Context:
         display_name: str,
         parent: "Context" = None,
         parent_entry_position: int = None,
+        parent_entry_position_end: int = None,
     ) -> None:
         self.display_name = display_name
         self.parent = parent
         self.parent_entry_position = parent_entry_position
+        self.parent_entry_position_end = parent_entry_position_end
         self.symbol_table = None
+        self.depth = parent.depth + 1 if parent else 0
+        self.max_depth = parent.max_depth if parent else None
+        self.environment = parent.environment if parent else None
+        self.options = parent.options if parent else {}
@@ -0,0 +1,56 @@
+from threading import Lock
+from .list import List
+from .lazy_list import LazyList
+from .value import Value
+
+
+class ForkedList(List):
+    def __init__(
+        self, source: "List", copies: dict[int, tuple["List", "List"]], lock: "Lock"
+    ) -> None:
+        self.source = source
+        self.copies = copies
+        self.lock = lock
+        self.materialized = None
+        self.context = source.context
+        self.position_start = source.position_start
+        self.position_end = source.position_end
+
+    @classmethod
+    def of(
+        cls, value: any, copies: dict[int, tuple["List", "List"]], lock: "Lock"
+    ) -> any:
+        if not isinstance(value, List):
+            return value
+        _, copy = copies.get(id(value), (None, None))
+        if copy is None:
+            if type(value) is LazyList and value.materialized is None:
+                copy = (
+                    LazyList(value.indexes, value.element)
+                    .set_context(value.context)
+                    .set_position(value.position_start, value.position_end)
+                )
+            else:
+                copy = cls(value, copies, lock)
+            copies[id(value)] = (value, copy)
+        return copy
+
+    @property
+    def elements(self) -> list["Value"]:
+        if self.materialized is None:
+            with self.lock:
+                if self.materialized is None:
+                    of, copies, lock = self.of, self.copies, self.lock
+                    self.materialized = [
+                        (
+                            of(element, copies, lock)
+                            if isinstance(element, List)
+                            else element
+                        )
+                        for element in self.source.elements
+                    ]
+        return self.materialized
+
+    @elements.setter
+    def elements(self, elements: list["Value"]) -> None:
+        self.materialized = elements
@@ -0,0 +1,45 @@
+from .symbol_table import SymbolTable
+from .constants.scopes import *
+
+
+class Frame(SymbolTable):
+    def __init__(self, layout: dict[str, int], parent: "SymbolTable") -> None:
+        super().__init__(parent)
+        self.layout = layout
+        self.slots = [None] * len(layout)
+
+    def get(self, name: str) -> any:
+        slot = self.layout.get(name)
+        if slot is not None and self.slots[slot] is not None:
+            return self.slots[slot]
+        return super().get(name)
+
+    def set(self, name: str, value: any) -> None:
+        slot = self.layout.get(name)
+        if slot is None:
+            self.table[name] = value
+        else:
+            self.slots[slot] = value
+
+    def remove(self, name: str) -> None:
+        slot = self.layout.get(name)
+        if slot is None:
+            del self.table[name]
+        else:
+            self.slots[slot] = None
+
+    def lookup(self, name: str, depth: int = None, slot: int = None) -> any:
+        if depth == DEPTH_LOCAL:
+            value = self.slots[slot]
+            if value is None:
+                return self.parent.get(name)
+            return value
+        return super().lookup(name, depth, slot)
+
+    def assign(
+        self, name: str, value: any, depth: int = None, slot: int = None
+    ) -> None:
+        if depth == DEPTH_LOCAL:
+            self.slots[slot] = value
+        else:
+            self.set(name, value)
@@ -1,6 +1,9 @@
+from typing import Callable
 from ..value import Value
+from ..position import Position
 from ..context import Context
 from ..symbol_table import SymbolTable
+from ..frame import Frame
 from ..run_time_result import RunTimeResult
 from ...errors.run_time_error import RunTimeError
 
@@ -9,33 +12,75 @@ class BaseFunction(Value):
     def __init__(self, name: str) -> None:
         super().__init__()
         self.name = name or "<anonymous>"
+        self.layout = None
 
-    def generate_new_context(self) -> "Context":
-        new_context = Context(self.name, self.context, self.position_start)
-        new_context.symbol_table = SymbolTable(new_context.parent.symbol_table)
+    def generate_new_context(
+        self,
+        context: "Context" = None,
+        position_start: "Position" = None,
+        position_end: "Position" = None,
+    ) -> "Context":
+        if context is None:
+            context = self.context
+            position_start, position_end = self.position_start, self.position_end
+        new_context = Context(self.name, context, position_start, position_end)
+        if self.layout is None:
+            new_context.symbol_table = SymbolTable(new_context.parent.symbol_table)
+        else:
+            new_context.symbol_table = Frame(
+                self.layout, new_context.parent.symbol_table
+            )
         return new_context
 
+    def prepare(
+        self,
+        context: "Context",
+        position_start: "Position" = None,
+        position_end: "Position" = None,
+        argument_count: int = None,
+    ) -> "Callable":
+        return lambda arguments: self.execute(
+            arguments, context, position_start, position_end
+        )
+
+    def check_depth(self, execution_context: "Context") -> "RunTimeResult":
+        response = RunTimeResult()
+        max_depth = execution_context.max_depth
+        if max_depth is not None and execution_context.depth > max_depth:
+            return response.failure(
+                RunTimeError(
+                    execution_context.parent_entry_position,
+                    execution_context.parent_entry_position_end,
+                    f"Maximum call depth exceeded ({max_depth}) calling '{self.name}'",
+                    execution_context.parent,
+                )
+            )
+        return response.success(None)
+
     def check_arguments(
-        self, argument_names: list, arguments: list["Value"]
+        self,
+        argument_names: list,
+        arguments: list["Value"],
+        execution_context: "Context",
     ) -> "RunTimeResult":
         response = RunTimeResult()
         if len(arguments) > len(argument_names):
             return response.failure(
                 RunTimeError(
-                    self.position_start,
-                    self.position_end,
+                    execution_context.parent_entry_position,
+                    execution_context.parent_entry_position_end,
                     f"{len(arguments) - len(argument_names)} too many arguments passed into '{self.name}'",
-                    self.context,
+                    execution_context.parent,
                 )
             )
 
         if len(arguments) < len(argument_names):
             return response.failure(
                 RunTimeError(
-                    self.position_start,
-                    self.position_end,
+                    execution_context.parent_entry_position,
+                    execution_context.parent_entry_position_end,
                     f"{len(argument_names) - len(arguments)} too few arguments passed into '{self.name}'",
-                    self.context,
+                    execution_context.parent,
                 )
             )
         return response.success(None)
@@ -47,10 +92,7 @@ class BaseFunction(Value):
         execution_context: "Context",
     ) -> None:
         for i in range(len(arguments)):
-            argument_name = argument_names[i]
-            argument_value = arguments[i]
-            argument_value.set_context(execution_context)
-            execution_context.symbol_table.set(argument_name, argument_value)
+            execution_context.symbol_table.set(argument_names[i], arguments[i])
 
     def check_and_populate_arguments(
         self,
@@ -59,7 +101,12 @@ class BaseFunction(Value):
         execution_context: "Context",
     ) -> "RunTimeResult":
         response = RunTimeResult()
-        response.register(self.check_arguments(argument_names, arguments))
+        response.register(self.check_depth(execution_context))
+        if response.should_return():
+            return response
+        response.register(
+            self.check_arguments(argument_names, arguments, execution_context)
+        )
         if response.should_return():
             return response
         self.populate_arguments(argument_names, arguments, execution_context)
@@ -1,3 +1,5 @@
+from statistics import fmean
+from typing import Callable
 from .base_function import BaseFunction
 from ..run_time_result import RunTimeResult
 from ...errors.run_time_error import RunTimeError
@@ -5,6 +7,9 @@ from ..context import Context
 from ..number import Number
 from ..string import String
 from ..list import List
+from ..array import Array
+from ..value import Value
+from ..position import Position
 
 
 class BuiltInFunction(BaseFunction):
@@ -14,12 +19,19 @@ class BuiltInFunction(BaseFunction):
     def __repr__(self) -> str:
         return f"<built-in function {self.name}>"
 
-    def execute(self, arguments) -> "RunTimeResult":
+    def execute(
+        self,
+        arguments: list["Value"],
+        context: "Context" = None,
+        position_start: "Position" = None,
+        position_end: "Position" = None,
+    ) -> "RunTimeResult":
         response = RunTimeResult()
-        context = self.generate_new_context()
+        context = self.generate_new_context(context, position_start, position_end)
 
-        method_name = f"execute_{self.name}"
-        method = getattr(self, method_name, self.no_visit_method)
+        method = self.methods.get(self.name)
+        if method is None:
+            return self.no_visit_method(arguments, context)
 
         response.register(
             self.check_and_populate_arguments(method.argument_names, arguments, context)
@@ -27,7 +39,7 @@ class BuiltInFunction(BaseFunction):
         if response.should_return():
             return response
 
-        return_value = response.register(method(context))
+        return_value = response.register(method(self, context))
         if response.should_return():
             return response
 
@@ -45,35 +57,47 @@ class BuiltInFunction(BaseFunction):
 
     def execute_print(self, context: "Context") -> "RunTimeResult":
         value = str(context.symbol_table.get("value"))
-        print(value)
-        return RunTimeResult().success(Number(len(value)))
-
-    def execute_input(self, _: "Context") -> "RunTimeResult":
-        value = input("> ")
+        print(value, file=context.environment.output)
+        return RunTimeResult().success(Number.of(len(value)))
+
+    def execute_input(self, context: "Context") -> "RunTimeResult":
+        environment = context.environment
+        if environment.input is None:
+            value = input("> ")
+        else:
+            print("> ", end="", file=environment.output)
+            value = environment.input.readline().rstrip("\n")
         try:
             number = int(value)
             return RunTimeResult().success(Number(number))
         except ValueError:
             return RunTimeResult().success(String(value))
 
-    def execute_clear(self, _: "Context") -> "RunTimeResult":
+    def execute_clear(self, context: "Context") -> "RunTimeResult":
         from os import system, name
 
-        system("cls" if name == "nt" else "clear")
+        if context.environment.output is None:
+            system("cls" if name == "nt" else "clear")
+        else:
+            print("\033[H\033[2J\033[3J", end="", file=context.environment.output)
         return RunTimeResult().success(Number.null)
 
     def execute_len(self, context: "Context") -> "RunTimeResult":
         value = context.symbol_table.get("value")
 
         if isinstance(value, List):
-            return RunTimeResult().success(Number(len(value.elements)))
+            return RunTimeResult().success(Number.of(len(value.elements)))
+        if isinstance(value, String):
+            return RunTimeResult().success(Number.of(value.length))
+        if isinstance(value, Array):
+            return RunTimeResult().success(Number.of(len(value)))
         try:
-            return RunTimeResult().success(Number(len(str(value))))
+            return RunTimeResult().success(Number.of(len(str(value))))
         except:
             return RunTimeResult().failure(
                 RunTimeError(
-                    self.position_start,
-                    self.position_end,
+                    context.parent_entry_position,
+                    context.parent_entry_position_end,
                     "Argument must be string, number or list",
                     context,
                 )
@@ -100,6 +124,13 @@ class BuiltInFunction(BaseFunction):
             else Number.false
         )
 
+    def execute_is_array(self, context: "Context") -> "RunTimeResult":
+        return RunTimeResult().success(
+            Number.true
+            if isinstance(context.symbol_table.get("value"), Array)
+            else Number.false
+        )
+
     def execute_is_function(self, context: "Context") -> "RunTimeResult":
         return RunTimeResult().success(
             Number.true
@@ -114,15 +145,15 @@ class BuiltInFunction(BaseFunction):
         if not isinstance(_list, List):
             return RunTimeResult().failure(
                 RunTimeError(
-                    self.position_start,
-                    self.position_end,
+                    context.parent_entry_position,
+                    context.parent_entry_position_end,
                     "First argument must be list",
                     context,
                 )
             )
 
         _list.elements.append(value)
-        return RunTimeResult().success(Number(len(_list.elements)))
+        return RunTimeResult().success(Number.of(len(_list.elements)))
 
     def execute_pop(self, context: "Context") -> "RunTimeResult":
         _list = context.symbol_table.get("list")
@@ -131,8 +162,8 @@ class BuiltInFunction(BaseFunction):
         if not isinstance(_list, List):
             return RunTimeResult().failure(
                 RunTimeError(
-                    self.position_start,
-                    self.position_end,
+                    context.parent_entry_position,
+                    context.parent_entry_position_end,
                     "First argument must be list",
                     context,
                 )
@@ -141,8 +172,8 @@ class BuiltInFunction(BaseFunction):
         if not isinstance(index, Number):
             return RunTimeResult().failure(
                 RunTimeError(
-                    self.position_start,
-                    self.position_end,
+                    context.parent_entry_position,
+                    context.parent_entry_position_end,
                     "Second argument must be number",
                     context,
                 )
@@ -153,8 +184,8 @@ class BuiltInFunction(BaseFunction):
         except:
             return RunTimeResult().failure(
                 RunTimeError(
-                    self.position_start,
-                    self.position_end,
+                    context.parent_entry_position,
+                    context.parent_entry_position_end,
                     "Index out of bounds",
                     context,
                 )
@@ -168,8 +199,8 @@ class BuiltInFunction(BaseFunction):
         if not isinstance(first_list, List):
             return RunTimeResult().failure(
                 RunTimeError(
-                    self.position_start,
-                    self.position_end,
+                    context.parent_entry_position,
+                    context.parent_entry_position_end,
                     "First argument must be list",
                     context,
                 )
@@ -178,55 +209,277 @@ class BuiltInFunction(BaseFunction):
         if not isinstance(second_list, List):
             return RunTimeResult().failure(
                 RunTimeError(
-                    self.position_start,
-                    self.position_end,
+                    context.parent_entry_position,
+                    context.parent_entry_position_end,
                     "Second argument must be list",
                     context,
                 )
             )
 
         first_list.elements.extend(second_list.elements)
-        return RunTimeResult().success(Number(len(first_list.elements)))
+        return RunTimeResult().success(Number.of(len(first_list.elements)))
+
+    def execute_map(self, context: "Context") -> "RunTimeResult":
+        _list = context.symbol_table.get("list")
+        function = context.symbol_table.get("function")
+        error = self.check_list_and_function(_list, function, context)
+        if error:
+            return error
+
+        call = self.prepare_callback(function, 1, context)
+        elements = []
+        for element in _list.elements:
+            result = call([element])
+            if result.should_return():
+                return result
+            elements.append(result.value)
+        return RunTimeResult().success(List(elements))
+
+    def execute_filter(self, context: "Context") -> "RunTimeResult":
+        _list = context.symbol_table.get("list")
+        function = context.symbol_table.get("function")
+        error = self.check_list_and_function(_list, function, context)
+        if error:
+            return error
+
+        call = self.prepare_callback(function, 1, context)
+        elements = []
+        for element in _list.elements:
+            result = call([element])
+            if result.should_return():
+                return result
+            if result.value.is_true():
+                elements.append(element)
+        return RunTimeResult().success(List(elements))
+
+    def execute_reduce(self, context: "Context") -> "RunTimeResult":
+        _list = context.symbol_table.get("list")
+        function = context.symbol_table.get("function")
+        error = self.check_list_and_function(_list, function, context)
+        if error:
+            return error
+
+        call = self.prepare_callback(function, 2, context)
+        value = context.symbol_table.get("initial")
+        for element in _list.elements:
+            result = call([value, element])
+            if result.should_return():
+                return result
+            value = result.value
+        return RunTimeResult().success(value)
+
+    def execute_range(self, context: "Context") -> "RunTimeResult":
+        start = context.symbol_table.get("start")
+        end = context.symbol_table.get("end")
+
+        if not all(
+            isinstance(value, Number) and type(value.value) is int
+            for value in (start, end)
+        ):
+            return self.argument_error("Arguments must be integers", context)
+
+        number = Number.of
+        return RunTimeResult().success(
+            List([number(value) for value in range(start.value, end.value)])
+        )
+
+    def execute_join(self, context: "Context") -> "RunTimeResult":
+        _list = context.symbol_table.get("list")
+        separator = context.symbol_table.get("separator")
+
+        if not isinstance(_list, List):
+            return self.argument_error("First argument must be list", context)
+        if not isinstance(separator, String):
+            return self.argument_error("Second argument must be string", context)
+
+        return RunTimeResult().success(
+            String(separator.value.join([str(element) for element in _list.elements]))
+        )
+
+    def execute_sum(self, context: "Context") -> "RunTimeResult":
+        return self.aggregate(Array.total, sum, True, context)
+
+    def execute_min(self, context: "Context") -> "RunTimeResult":
+        return self.aggregate(Array.minimum, min, False, context)
+
+    def execute_max(self, context: "Context") -> "RunTimeResult":
+        return self.aggregate(Array.maximum, max, False, context)
+
+    def execute_mean(self, context: "Context") -> "RunTimeResult":
+        return self.aggregate(Array.mean, fmean, False, context)
+
+    def execute_sort(self, context: "Context") -> "RunTimeResult":
+        values = context.symbol_table.get("values")
+
+        if isinstance(values, Array):
+            return RunTimeResult().success(values.sorted())
+        numbers, error = self.numbers(values, context)
+        if error:
+            return error
+        return RunTimeResult().success(
+            List([Number.of(number) for number in sorted(numbers)])
+        )
+
+    def execute_to_array(self, context: "Context") -> "RunTimeResult":
+        values = context.symbol_table.get("values")
+
+        if isinstance(values, Array):
+            return RunTimeResult().success(values.copy())
+        numbers, error = self.numbers(values, context)
+        if error:
+            return error
+        try:
+            return RunTimeResult().success(Array.of(numbers))
+        except TypeError:
+            return self.argument_error("List must contain only real numbers", context)
+        except OverflowError:
+            return self.argument_error("Number too large for an array", context)
+
+    def execute_to_list(self, context: "Context") -> "RunTimeResult":
+        values = context.symbol_table.get("array")
+
+        if not isinstance(values, Array):
+            return self.argument_error("Argument must be array", context)
+        return RunTimeResult().success(
+            List([Number.of(number) for number in values.to_list()])
+        )
+
+    def numbers(
+        self, values: "Value", context: "Context"
+    ) -> tuple[list[float], "RunTimeResult"]:
+        if not isinstance(values, List):
+            return None, self.argument_error("Argument must be list or array", context)
+        if not all(isinstance(element, Number) for element in values.elements):
+            return None, self.argument_error("List must contain only numbers", context)
+        return [element.value for element in values.elements], None
+
+    def aggregate(
+        self,
+        method: "Callable",
+        function: "Callable",
+        allow_empty: bool,
+        context: "Context",
+    ) -> "RunTimeResult":
+        values = context.symbol_table.get("values")
+
+        if isinstance(values, Array):
+            if not allow_empty and not len(values):
+                return self.argument_error("Array must not be empty", context)
+            return RunTimeResult().success(Number.of(method(values)))
+        numbers, error = self.numbers(values, context)
+        if error:
+            return error
+        if not allow_empty and not numbers:
+            return self.argument_error("List must not be empty", context)
+        return RunTimeResult().success(Number.of(function(numbers)))
+
+    def check_list_and_function(
+        self, _list: "Value", function: "Value", context: "Context"
+    ) -> "RunTimeResult":
+        if not isinstance(_list, List):
+            return self.argument_error("First argument must be list", context)
+        if not isinstance(function, BaseFunction):
+            return self.argument_error("Second argument must be function", context)
+        return None
+
+    def prepare_callback(
+        self, function: "BaseFunction", argument_count: int, context: "Context"
+    ) -> "Callable":
+        return function.prepare(
+            context.parent,
+            context.parent_entry_position,
+            context.parent_entry_position_end,
+            argument_count,
+        )
+
+    def argument_error(self, details: str, context: "Context") -> "RunTimeResult":
+        return RunTimeResult().failure(
+            RunTimeError(
+                context.parent_entry_position,
+                context.parent_entry_position_end,
+                details,
+                context,
+            )
+        )
 
     def execute_run(self, context: "Context") -> "RunTimeResult":
+        return self.load_module(context, False)
+
+    def execute_reload(self, context: "Context") -> "RunTimeResult":
+        return self.load_module(context, True)
+
+    def load_module(self, context: "Context", reload: bool) -> "RunTimeResult":
         from ...shell import run
 
         file_name = context.symbol_table.get("file_name")
         if not isinstance(file_name, String):
             return RunTimeResult().failure(
                 RunTimeError(
-                    self.position_start,
-                    self.position_end,
+                    context.parent_entry_position,
+                    context.parent_entry_position_end,
                     "Argument must be string",
                     context,
                 )
             )
 
         file_name = file_name.value
+        environment = context.environment
+        global_symbol_table = environment.symbol_table
+        module_registry = environment.modules
+        cycle = module_registry.cycle(file_name)
+        if cycle:
+            return RunTimeResult().failure(
+                RunTimeError(
+                    context.parent_entry_position,
+                    context.parent_entry_position_end,
+                    f'Circular run of file "{file_name}" ({" -> ".join(cycle)})',
+                    context,
+                )
+            )
+
+        namespace = None if reload else module_registry.get(file_name)
+        if namespace is not None:
+            global_symbol_table.table.update(namespace)
+            module_registry.record(namespace)
+            return RunTimeResult().success(Number.null)
+
         try:
-            with open(file_name, "r") as f:
-                script = f.read()
+            f = open(file_name, "r")
         except Exception as e:
             return RunTimeResult().failure(
                 RunTimeError(
-                    self.position_start,
-                    self.position_end,
+                    context.parent_entry_position,
+                    context.parent_entry_position_end,
                     f'Failed to load file "{file_name}"\n{str(e)}',
                     context,
                 )
             )
 
-        _, error = run(file_name, script)
+        module_registry.begin(file_name)
+        try:
+            with f:
+                _, error = run(
+                    file_name,
+                    stream=f,
+                    environment=environment,
+                    is_used=False,
+                    caller=context,
+                    **context.options,
+                )
+        finally:
+            names = module_registry.end()
         if error:
+            module_registry.remove(file_name)
             return RunTimeResult().failure(
                 RunTimeError(
-                    self.position_start,
-                    self.position_end,
+                    context.parent_entry_position,
+                    context.parent_entry_position_end,
                     f'Failed to finish executing file "{file_name}"\n{error.as_string()}',
                     context,
                 )
             )
 
+        module_registry.store(file_name, names, global_symbol_table.table)
         return RunTimeResult().success(Number.null)
 
     execute_print.argument_names = ["value"]
@@ -240,8 +493,28 @@ class BuiltInFunction(BaseFunction):
     execute_append.argument_names = ["list", "value"]
     execute_pop.argument_names = ["list", "index"]
     execute_extend.argument_names = ["first_list", "second_list"]
+    execute_map.argument_names = ["list", "function"]
+    execute_filter.argument_names = ["list", "function"]
+    execute_reduce.argument_names = ["list", "function", "initial"]
+    execute_range.argument_names = ["start", "end"]
+    execute_join.argument_names = ["list", "separator"]
+    execute_sum.argument_names = ["values"]
+    execute_min.argument_names = ["values"]
+    execute_max.argument_names = ["values"]
+    execute_mean.argument_names = ["values"]
+    execute_sort.argument_names = ["values"]
+    execute_to_array.argument_names = ["values"]
+    execute_to_list.argument_names = ["array"]
+    execute_is_array.argument_names = ["value"]
     execute_run.argument_names = ["file_name"]
+    execute_reload.argument_names = ["file_name"]
+
 
+BuiltInFunction.methods = {
+    name[len("execute_") :]: method
+    for name, method in vars(BuiltInFunction).items()
+    if name.startswith("execute_")
+}
 
 BuiltInFunction.print = BuiltInFunction("print")
 BuiltInFunction.input = BuiltInFunction("input")
@@ -254,4 +527,18 @@ BuiltInFunction.is_function = BuiltInFunction("is_function")
 BuiltInFunction.append = BuiltInFunction("append")
 BuiltInFunction.pop = BuiltInFunction("pop")
 BuiltInFunction.extend = BuiltInFunction("extend")
+BuiltInFunction.map = BuiltInFunction("map")
+BuiltInFunction.filter = BuiltInFunction("filter")
+BuiltInFunction.reduce = BuiltInFunction("reduce")
+BuiltInFunction.range = BuiltInFunction("range")
+BuiltInFunction.join = BuiltInFunction("join")
+BuiltInFunction.sum = BuiltInFunction("sum")
+BuiltInFunction.min = BuiltInFunction("min")
+BuiltInFunction.max = BuiltInFunction("max")
+BuiltInFunction.mean = BuiltInFunction("mean")
+BuiltInFunction.sort = BuiltInFunction("sort")
+BuiltInFunction.to_array = BuiltInFunction("to_array")
+BuiltInFunction.to_list = BuiltInFunction("to_list")
+BuiltInFunction.is_array = BuiltInFunction("is_array")
 BuiltInFunction.run = BuiltInFunction("run")
+BuiltInFunction.reload = BuiltInFunction("reload")
@@ -1,8 +1,14 @@
+from typing import Callable
 from ..nodes.binary_operation_node import BinaryOperationNode
 from ..run_time_result import RunTimeResult
 from ..value import Value
 from .base_function import BaseFunction
 from ..number import Number
+from ..code import Code
+from ..context import Context
+from ..position import Position
+from ..symbol_table import SymbolTable
+from ..frame import Frame
 
 
 class Function(BaseFunction):
@@ -12,21 +18,28 @@ class Function(BaseFunction):
         body_node: "BinaryOperationNode",
         argument_names: list,
         is_automatic_return: bool = False,
+        code: "Code" = None,
+        layout: dict[str, int] = None,
     ) -> None:
         super().__init__(name)
         self.body_node = body_node
         self.argument_names = argument_names
         self.is_automatic_return = is_automatic_return
+        self.code = code
+        self.layout = layout
 
     def __repr__(self) -> str:
         return f"<function {self.name}>"
 
-    def execute(self, arguments: list["Value"]) -> "RunTimeResult":
-        from ...interpreter import Interpreter
-
+    def execute(
+        self,
+        arguments: list["Value"],
+        context: "Context" = None,
+        position_start: "Position" = None,
+        position_end: "Position" = None,
+    ) -> "RunTimeResult":
         response = RunTimeResult()
-        interpreter = Interpreter()
-        context = self.generate_new_context()
+        context = self.generate_new_context(context, position_start, position_end)
 
         response.register(
             self.check_and_populate_arguments(self.argument_names, arguments, context)
@@ -34,7 +47,19 @@ class Function(BaseFunction):
         if response.should_return():
             return response
 
-        value = response.register(interpreter.visit(self.body_node, context))
+        if self.code:
+            from ...virtual_machine import VirtualMachine
+
+            result = VirtualMachine().run(self.code, context)
+        else:
+            from ...interpreter import Interpreter
+
+            result = Interpreter().call(self, context)
+        return self.finish(result)
+
+    def finish(self, result: "RunTimeResult") -> "RunTimeResult":
+        response = RunTimeResult()
+        value = response.register(result)
         if response.should_return() and response.return_value is None:
             return response
         return response.success(
@@ -43,10 +68,51 @@ class Function(BaseFunction):
             or Number.null
         )
 
+    def prepare(
+        self,
+        context: "Context",
+        position_start: "Position" = None,
+        position_end: "Position" = None,
+        argument_count: int = None,
+    ) -> "Callable":
+        max_depth = context.max_depth
+        if argument_count != len(self.argument_names) or (
+            max_depth is not None and context.depth + 1 > max_depth
+        ):
+            return super().prepare(context, position_start, position_end)
+
+        if self.code:
+            from ...virtual_machine import VirtualMachine
+
+            run, target = VirtualMachine().run, self.code
+        else:
+            from ...interpreter import Interpreter
+
+            run, target = Interpreter().call, self
+        name, layout, argument_names = self.name, self.layout, self.argument_names
+        symbol_table = context.symbol_table
+
+        def call(arguments: list["Value"]) -> "RunTimeResult":
+            execution_context = Context(name, context, position_start, position_end)
+            execution_context.symbol_table = (
+                SymbolTable(symbol_table)
+                if layout is None
+                else Frame(layout, symbol_table)
+            )
+            self.populate_arguments(argument_names, arguments, execution_context)
+            return self.finish(run(target, execution_context))
+
+        return call
+
     def copy(self) -> "Function":
         return (
             Function(
-                self.name, self.body_node, self.argument_names, self.is_automatic_return
+                self.name,
+                self.body_node,
+                self.argument_names,
+                self.is_automatic_return,
+                self.code,
+                self.layout,
             )
             .set_context(self.context)
             .set_position(self.position_start, self.position_end)
@@ -0,0 +1,80 @@
+from typing import Callable
+from .base_function import BaseFunction
+from ..run_time_result import RunTimeResult
+from ...errors.run_time_error import RunTimeError
+from ..context import Context
+from ..number import Number
+from ..string import String
+from ..list import List
+from ..array import Array
+from ..value import Value
+from ..position import Position
+
+
+class NativeFunction(BaseFunction):
+    def __init__(self, name: str, function: "Callable") -> None:
+        super().__init__(name)
+        self.function = function
+
+    def __repr__(self) -> str:
+        return f"<native function {self.name}>"
+
+    @staticmethod
+    def to_value(value: any) -> "Value":
+        if isinstance(value, Value):
+            return value
+        if value is None:
+            return Number.null
+        if isinstance(value, bool):
+            return Number.true if value else Number.false
+        if isinstance(value, (int, float)):
+            return Number.of(value)
+        if isinstance(value, str):
+            return String(value)
+        if isinstance(value, Array.backing_types()):
+            return Array.of(value)
+        if isinstance(value, (list, tuple)):
+            return List([NativeFunction.to_value(element) for element in value])
+        if callable(value):
+            return NativeFunction(getattr(value, "__name__", None), value)
+        raise Exception(f"Cannot convert {type(value).__name__} to an arcane value")
+
+    @staticmethod
+    def to_python(value: "Value") -> any:
+        if isinstance(value, (Number, String)):
+            return value.value
+        if isinstance(value, List):
+            return [NativeFunction.to_python(element) for element in value.elements]
+        if isinstance(value, Array):
+            return value.values
+        if isinstance(value, NativeFunction):
+            return value.function
+        return value
+
+    def execute(
+        self,
+        arguments: list["Value"],
+        context: "Context" = None,
+        position_start: "Position" = None,
+        position_end: "Position" = None,
+    ) -> "RunTimeResult":
+        to_python = NativeFunction.to_python
+        try:
+            value = self.function(*[to_python(argument) for argument in arguments])
+            return RunTimeResult().success(NativeFunction.to_value(value))
+        except Exception as e:
+            return RunTimeResult().failure(
+                RunTimeError(
+                    position_start or self.position_start,
+                    position_end or self.position_end,
+                    f"{e.__class__.__name__} in '{self.name}': {e}",
+                    context or self.context,
+                )
+            )
+
+    def copy(self) -> "NativeFunction":
+        return (
+            NativeFunction(self.name, self.function)
+            .set_context(self.context)
+            .set_position(self.position_start, self.position_end)
+        )
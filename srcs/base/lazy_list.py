@@ -0,0 +1,35 @@
+from typing import Callable
+from .list import List
+from .value import Value
+from .number import Number
+from ..errors.run_time_error import RunTimeError
+
+
+class LazyList(List):
+    def __init__(self, indexes: range, element: Callable[[int], "Value"]) -> None:
+        self.indexes = indexes
+        self.element = element
+        super().__init__(None)
+
+    @property
+    def elements(self) -> list["Value"]:
+        if self.materialized is None:
+            self.materialized = [self.element(i) for i in self.indexes]
+        return self.materialized
+
+    @elements.setter
+    def elements(self, elements: list["Value"]) -> None:
+        self.materialized = elements
+
+    def divided_by(self, other: "Value") -> tuple["Value", "RunTimeError"]:
+        if self.materialized is None and isinstance(other, Number):
+            try:
+                return self.element(self.indexes[other.value]), None
+            except (IndexError, TypeError):
+                return None, RunTimeError(
+                    other.position_start,
+                    other.position_end,
+                    "Index out of bounds",
+                    self.context,
+                )
+        return super().divided_by(other)
@@ -3,6 +3,14 @@ from ..token import Token
 
 
 class BinaryOperationNode:
+    __slots__ = (
+        "left_node",
+        "operator_token",
+        "right_node",
+        "position_start",
+        "position_end",
+    )
+
     def __init__(
         self, left_node: "NumberNode", operator_token: "Token", right_node: "NumberNode"
     ) -> None:
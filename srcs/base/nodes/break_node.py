@@ -2,6 +2,8 @@ from ..position import Position
 
 
 class BreakNode:
+    __slots__ = ("position_start", "position_end")
+
     def __init__(self, position_start: "Position", position_end: "Position" = None):
         self.position_start = position_start
         self.position_end = position_end
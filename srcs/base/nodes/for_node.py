@@ -3,6 +3,21 @@ from .binary_operation_node import BinaryOperationNode
 
 
 class ForNode:
+    __slots__ = (
+        "token",
+        "start_value",
+        "end_value",
+        "increment_value",
+        "body",
+        "position_start",
+        "position_end",
+        "is_null",
+        "is_used",
+        "is_lazy",
+        "depth",
+        "slot",
+    )
+
     def __init__(
         self,
         token: "Token",
@@ -20,3 +35,7 @@ class ForNode:
         self.position_start = self.token.position_start
         self.position_end = self.body.position_end
         self.is_null = is_null
+        self.is_used = True
+        self.is_lazy = False
+        self.depth = None
+        self.slot = None
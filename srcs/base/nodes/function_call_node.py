@@ -3,6 +3,14 @@ from .binary_operation_node import BinaryOperationNode
 
 
 class FunctionCallNode:
+    __slots__ = (
+        "node_to_call",
+        "arguments",
+        "position_start",
+        "position_end",
+        "is_tail",
+    )
+
     def __init__(
         self,
         node_to_call: "FunctionDefinitionNode",
@@ -15,3 +23,4 @@ class FunctionCallNode:
             self.position_end = self.arguments[len(self.arguments) - 1].position_end
         else:
             self.position_end = self.node_to_call.position_end
+        self.is_tail = False
@@ -3,6 +3,18 @@ from .binary_operation_node import BinaryOperationNode
 
 
 class FunctionDefinitionNode:
+    __slots__ = (
+        "token",
+        "arguments",
+        "body",
+        "position_start",
+        "position_end",
+        "is_automatic_return",
+        "depth",
+        "slot",
+        "layout",
+    )
+
     def __init__(
         self,
         token: "Token",
@@ -21,3 +33,6 @@ class FunctionDefinitionNode:
             self.position_start = self.body[0].position_start
         self.position_end = self.body.position_end
         self.is_automatic_return = is_automatic_return
+        self.depth = None
+        self.slot = None
+        self.layout = None
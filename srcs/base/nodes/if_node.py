@@ -1,4 +1,6 @@
 class IfNode:
+    __slots__ = ("cases", "else_case", "position_start", "position_end", "is_used")
+
     def __init__(self, cases, else_case):
         self.cases = cases
         self.else_case = else_case
@@ -6,3 +8,4 @@ class IfNode:
         self.position_end = (self.else_case or self.cases[len(self.cases) - 1])[
             0
         ].position_end
+        self.is_used = True
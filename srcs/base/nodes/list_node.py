@@ -3,6 +3,8 @@ from ..position import Position
 
 
 class ListNode:
+    __slots__ = ("element_nodes", "position_start", "position_end", "is_used")
+
     def __init__(
         self,
         element_nodes: list["Token"],
@@ -12,3 +14,4 @@ class ListNode:
         self.element_nodes = element_nodes
         self.position_start = position_start
         self.position_end = position_end
+        self.is_used = True
@@ -2,6 +2,8 @@ from ..position import Position
 
 
 class ReturnNode:
+    __slots__ = ("to_return", "position_start", "position_end")
+
     def __init__(
         self, to_return, position_start: "Position", position_end: "Position" = None
     ):
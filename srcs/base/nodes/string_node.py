@@ -2,10 +2,13 @@ from ..token import Token
 
 
 class StringNode:
+    __slots__ = ("token", "position_start", "position_end", "value")
+
     def __init__(self, token: "Token") -> None:
         self.token = token
         self.position_start = self.token.position_start
         self.position_end = self.token.position_end
+        self.value = None
 
     def __repr__(self) -> str:
         return f"{self.token}"
@@ -3,6 +3,8 @@ from ..token import Token
 
 
 class UnaryOperationNode:
+    __slots__ = ("operator_token", "node", "position_start", "position_end")
+
     def __init__(self, operator_token: "Token", node: "NumberNode") -> None:
         self.operator_token = operator_token
         self.node = node
@@ -2,7 +2,17 @@ from ..token import Token
 
 
 class VariableAccessNode:
+    __slots__ = (
+        "variable_name_token",
+        "position_start",
+        "position_end",
+        "depth",
+        "slot",
+    )
+
     def __init__(self, token: "Token") -> None:
         self.variable_name_token = token
         self.position_start = self.variable_name_token.position_start
         self.position_end = self.variable_name_token.position_end
+        self.depth = None
+        self.slot = None
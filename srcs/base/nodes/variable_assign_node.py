@@ -3,8 +3,19 @@ from .binary_operation_node import BinaryOperationNode
 
 
 class VariableAssignNode:
+    __slots__ = (
+        "variable_name_token",
+        "value_node",
+        "position_start",
+        "position_end",
+        "depth",
+        "slot",
+    )
+
     def __init__(self, token: "Token", value_node: "BinaryOperationNode") -> None:
         self.variable_name_token = token
         self.value_node = value_node
         self.position_start = self.variable_name_token.position_start
         self.position_end = self.value_node.position_end
+        self.depth = None
+        self.slot = None
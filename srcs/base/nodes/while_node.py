@@ -2,6 +2,15 @@ from .binary_operation_node import BinaryOperationNode
 
 
 class WhileNode:
+    __slots__ = (
+        "condition",
+        "body",
+        "position_start",
+        "position_end",
+        "is_null",
+        "is_used",
+    )
+
     def __init__(
         self,
         condition: "BinaryOperationNode",
@@ -13,3 +22,4 @@ class WhileNode:
         self.position_start = self.condition.position_start
         self.position_end = self.body.position_end
         self.is_null = is_null
+        self.is_used = True
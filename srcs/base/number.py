@@ -2,12 +2,40 @@ from ..base.position import Position
 from ..errors.run_time_error import RunTimeError
 from .context import Context
 from .value import Value
+from .constants.limits import *
 
 
 class Number(Value):
+    __slots__ = ("value",)
+    cache: list["Number"] = None
+
     def __init__(self, value: float) -> None:
-        super().__init__()
         self.value = value
+        self.position_start = None
+        self.position_end = None
+        self.context = None
+
+    @staticmethod
+    def of(value: float) -> "Number":
+        cache = Number.cache
+        if (
+            cache is not None
+            and type(value) is int
+            and NUMBER_CACHE_MIN <= value <= NUMBER_CACHE_MAX
+        ):
+            return cache[value - NUMBER_CACHE_MIN]
+        return Number(value)
+
+    @staticmethod
+    def set_cache(enabled: bool) -> None:
+        if not enabled:
+            Number.cache = None
+            return
+        Number.cache = [
+            Number(value) for value in range(NUMBER_CACHE_MIN, NUMBER_CACHE_MAX + 1)
+        ]
+        Number.cache[-NUMBER_CACHE_MIN] = Number.false
+        Number.cache[1 - NUMBER_CACHE_MIN] = Number.true
 
     def __repr__(self) -> str:
         return f"{self.value}"
@@ -35,17 +63,17 @@ class Number(Value):
 
     def added_to(self, other: "Number") -> tuple["Number", "RunTimeError"]:
         if isinstance(other, Number):
-            return Number(self.value + other.value).set_context(self.context), None
+            return Number.of(self.value + other.value), None
         return None, Value.illegal_operation(self.position_start, self.position_end)
 
     def subtracted_by(self, other: "Number") -> tuple["Number", "RunTimeError"]:
         if isinstance(other, Number):
-            return Number(self.value - other.value).set_context(self.context), None
+            return Number.of(self.value - other.value), None
         return None, Value.illegal_operation(self.position_start, self.position_end)
 
     def multiplied_by(self, other: "Number") -> tuple["Number", "RunTimeError"]:
         if isinstance(other, Number):
-            return Number(self.value * other.value).set_context(self.context), None
+            return Number.of(self.value * other.value), None
         return None, Value.illegal_operation(self.position_start, self.position_end)
 
     def divided_by(self, other: "Number") -> tuple["Number", "RunTimeError"]:
@@ -57,7 +85,7 @@ class Number(Value):
                     "Division by zero",
                     self.context,
                 )
-            return Number(self.value / other.value).set_context(self.context), None
+            return Number.of(self.value / other.value), None
         return None, Value.illegal_operation(self.position_start, self.position_end)
 
     def moduled_by(self, other: "Number") -> tuple["Number", "RunTimeError"]:
@@ -69,80 +97,56 @@ class Number(Value):
                     "Division by zero",
                     self.context,
                 )
-            return Number(self.value % other.value).set_context(self.context), None
+            return Number.of(self.value % other.value), None
         return None, Value.illegal_operation(self.position_start, self.position_end)
 
     def powered_by(self, other: "Number") -> tuple["Number", "RunTimeError"]:
         if isinstance(other, Number):
-            return Number(self.value**other.value).set_context(self.context), None
+            return Number.of(self.value**other.value), None
         return None, Value.illegal_operation(self.position_start, self.position_end)
 
     def get_comparison_eq(self, other: "Number") -> tuple["Number", "RunTimeError"]:
         if isinstance(other, Number):
-            return (
-                Number(int(self.value == other.value)).set_context(self.context),
-                None,
-            )
+            return Number.of(int(self.value == other.value)), None
         return None, Value.illegal_operation(self.position_start, self.position_end)
 
     def get_comparison_neq(self, other: "Number") -> tuple["Number", "RunTimeError"]:
         if isinstance(other, Number):
-            return (
-                Number(int(self.value != other.value)).set_context(self.context),
-                None,
-            )
+            return Number.of(int(self.value != other.value)), None
         return None, Value.illegal_operation(self.position_start, self.position_end)
 
     def get_comparison_lt(self, other: "Number") -> tuple["Number", "RunTimeError"]:
         if isinstance(other, Number):
-            return (
-                Number(int(self.value < other.value)).set_context(self.context),
-                None,
-            )
+            return Number.of(int(self.value < other.value)), None
         return None, Value.illegal_operation(self.position_start, self.position_end)
 
     def get_comparison_lte(self, other: "Number") -> tuple["Number", "RunTimeError"]:
         if isinstance(other, Number):
-            return (
-                Number(int(self.value <= other.value)).set_context(self.context),
-                None,
-            )
+            return Number.of(int(self.value <= other.value)), None
         return None, Value.illegal_operation(self.position_start, self.position_end)
 
     def get_comparison_gt(self, other: "Number") -> tuple["Number", "RunTimeError"]:
         if isinstance(other, Number):
-            return (
-                Number(int(self.value > other.value)).set_context(self.context),
-                None,
-            )
+            return Number.of(int(self.value > other.value)), None
         return None, Value.illegal_operation(self.position_start, self.position_end)
 
     def get_comparison_gte(self, other: "Number") -> tuple["Number", "RunTimeError"]:
         if isinstance(other, Number):
-            return (
-                Number(int(self.value >= other.value)).set_context(self.context),
-                None,
-            )
+            return Number.of(int(self.value >= other.value)), None
         return None, Value.illegal_operation(self.position_start, self.position_end)
 
     def anded_by(self, other: "Number") -> tuple["Number", "RunTimeError"]:
         if isinstance(other, Number):
-            return (
-                Number(int(self.value and other.value)).set_context(self.context),
-                None,
-            )
+            return Number.of(int(self.value and other.value)), None
         return None, Value.illegal_operation(self.position_start, self.position_end)
 
     def ored_by(self, other: "Number") -> tuple["Number", "RunTimeError"]:
         if isinstance(other, Number):
-            return (
-                Number(int(self.value or other.value)).set_context(self.context),
-                None,
-            )
+            return Number.of(int(self.value or other.value)), None
         return None, Value.illegal_operation(self.position_start, self.position_end)
 
     def notted(self) -> tuple["Number", "RunTimeError"]:
-        return Number(int(not self.value)).set_context(self.context), None
+        return Number.of(int(not self.value)), None
 
 
 Number.null = Number(0)
@@ -151,3 +155,5 @@ Number.true = Number(1)
 Number.PI = Number(
     3.141592653589793238462643383279502884197169399375105820974944592307816406286
 )
+
+Number.set_cache(True)
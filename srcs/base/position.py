@@ -1,24 +1,37 @@
+from .source import Source
+
+
 class Position:
-    def __init__(
-        self, index: int, line: int, column: int, file_name: str, file_text: str
-    ) -> None:
+    __slots__ = ("index", "source", "is_line_end")
+
+    def __init__(self, index: int, source: "Source", is_line_end: bool = False) -> None:
         self.index = index
-        self.line = line
-        self.column = column
-        self.file_name = file_name
-        self.file_text = file_text
+        self.source = source
+        self.is_line_end = is_line_end
 
-    def advance(self, current_character: str = None) -> "Position":
-        self.index += 1
-        self.column += 1
+    @property
+    def line(self) -> int:
+        return self.source.locate(self.index - self.is_line_end)[0]
+
+    @property
+    def column(self) -> int:
+        return self.source.locate(self.index - self.is_line_end)[1] + self.is_line_end
 
-        if current_character == "\n":
-            self.line += 1
-            self.column = 0
+    @property
+    def file_name(self) -> str:
+        return self.source.file_name
 
+    @property
+    def file_text(self) -> str:
+        return self.source.text
+
+    def advance(self, current_character: str = None) -> "Position":
+        self.is_line_end = (
+            current_character is None
+            and self.source.character(self.index) == "\n"
+        )
+        self.index += 1
         return self
 
     def copy(self) -> "Position":
-        return Position(
-            self.index, self.line, self.column, self.file_name, self.file_text
-        )
+        return Position(self.index, self.source, self.is_line_end)
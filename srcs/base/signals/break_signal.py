@@ -0,0 +1,5 @@
+from .signal import Signal
+
+
+class BreakSignal(Signal):
+    pass
@@ -0,0 +1,5 @@
+from .signal import Signal
+
+
+class ContinueSignal(Signal):
+    pass
@@ -0,0 +1,7 @@
+from .signal import Signal
+from ...errors.run_time_error import RunTimeError
+
+
+class ErrorSignal(Signal):
+    def __init__(self, error: "RunTimeError") -> None:
+        self.error = error
@@ -0,0 +1,7 @@
+from .signal import Signal
+from ..value import Value
+
+
+class ReturnSignal(Signal):
+    def __init__(self, value: "Value") -> None:
+        self.value = value
@@ -0,0 +1,17 @@
+from .signal import Signal
+from ..value import Value
+from ..position import Position
+
+
+class TailCallSignal(Signal):
+    def __init__(
+        self,
+        function: "Value",
+        arguments: list["Value"],
+        position_start: "Position",
+        position_end: "Position",
+    ) -> None:
+        self.function = function
+        self.arguments = arguments
+        self.position_start = position_start
+        self.position_end = position_end
@@ -0,0 +1,44 @@
+from bisect import bisect_right
+
+
+class Source:
+    __slots__ = ("file_name", "chunks", "starts", "length", "line_starts")
+
+    def __init__(self, file_name: str, text: str = "") -> None:
+        self.file_name = file_name
+        self.chunks = [text]
+        self.starts = [0]
+        self.length = len(text)
+        self.line_starts = None
+
+    @property
+    def text(self) -> str:
+        if len(self.chunks) > 1:
+            self.chunks = ["".join(self.chunks)]
+            self.starts = [0]
+        return self.chunks[0]
+
+    def append(self, text: str) -> None:
+        self.chunks.append(text)
+        self.starts.append(self.length)
+        self.length += len(text)
+        self.line_starts = None
+
+    def character(self, index: int) -> str:
+        if index >= self.starts[-1]:
+            chunk = len(self.chunks) - 1
+        else:
+            chunk = max(bisect_right(self.starts, index) - 1, 0)
+        index -= self.starts[chunk]
+        return self.chunks[chunk][index : index + 1] if index >= 0 else ""
+
+    def locate(self, index: int) -> tuple[int, int]:
+        if self.line_starts is None:
+            text = self.text
+            self.line_starts = [0]
+            start = text.find("\n")
+            while start >= 0:
+                self.line_starts.append(start + 1)
+                start = text.find("\n", start + 1)
+        line = max(bisect_right(self.line_starts, index) - 1, 0)
+        return line, index - self.line_starts[line]
@@ -3,22 +3,55 @@ from ..errors.run_time_error import RunTimeError
 from .value import Value
 from .number import Number
 
+ROPE_MIN_LENGTH = 256
+
 
 class String(Value):
-    def __init__(self, value: str) -> None:
+    __slots__ = ("text", "pieces", "count", "length")
+
+    def __init__(
+        self, value: str = None, pieces: list[str] = None, length: int = None
+    ) -> None:
         super().__init__()
-        self.value = value
+        self.text = value
+        self.pieces = pieces
+        self.count = len(pieces) if pieces else 0
+        self.length = len(value) if length is None else length
+
+    @property
+    def value(self) -> str:
+        if self.text is None:
+            pieces = self.pieces
+            self.text = "".join(
+                pieces if len(pieces) == self.count else pieces[: self.count]
+            )
+        return self.text
 
     def __repr__(self) -> str:
         return f'"{self.value}"'
-    
+
     def __str__(self):
         return self.value
 
     def added_to(self, other: "String") -> tuple["String", "RunTimeError"]:
-        if isinstance(other, String):
+        if not isinstance(other, String):
+            return None, Value.illegal_operation(self, other)
+        length = self.length + other.length
+        if length < ROPE_MIN_LENGTH:
             return String(self.value + other.value).set_context(self.context), None
-        return None, Value.illegal_operation(self, other)
+        pieces, count, value = self.pieces, self.count, other.value
+        if pieces is None:
+            pieces, count = [self.text, value], 1
+        elif len(pieces) != count:
+            pieces = pieces[:count] + [value]
+        else:
+            pieces.append(value)
+            # another thread may have extended the shared list first
+            if pieces[count] is not value:
+                pieces = pieces[:count] + [value]
+        string = String(None, pieces, length)
+        string.count = count + 1
+        return string.set_context(self.context), None
 
     def multiplied_by(self, other: "String") -> tuple["String", "RunTimeError"]:
         if isinstance(other, Number):
@@ -26,11 +59,11 @@ class String(Value):
         return None, Value.illegal_operation(self, other)
 
     def is_true(self) -> bool:
-        return len(self.value) > 0
+        return self.length > 0
 
     def copy(self) -> "String":
-        return (
-            String(self.value)
-            .set_context(self.context)
-            .set_position(self.position_start, self.position_end)
+        string = String(self.text, self.pieces, self.length)
+        string.count = self.count
+        return string.set_context(self.context).set_position(
+            self.position_start, self.position_end
         )
@@ -1,7 +1,12 @@
+from .constants.scopes import *
+
+
 class SymbolTable:
     def __init__(self, parent=None) -> None:
         self.table = {}
         self.parent = parent
+        self.globals = parent.globals if parent else self
+        self.bound_names: set[str] = parent.bound_names if parent else set()
 
     def get(self, name: str) -> "SymbolTable":
         value = self.table.get(name, None)
@@ -14,3 +19,18 @@ class SymbolTable:
 
     def remove(self, name: str) -> None:
         del self.table[name]
+
+    def get_global(self, name: str) -> any:
+        if name in self.bound_names:
+            return self.get(name)
+        return self.globals.table.get(name, None)
+
+    def lookup(self, name: str, depth: int = None, slot: int = None) -> any:
+        if depth == DEPTH_GLOBAL:
+            return self.get_global(name)
+        return self.get(name)
+
+    def assign(
+        self, name: str, value: any, depth: int = None, slot: int = None
+    ) -> None:
+        self.set(name, value)
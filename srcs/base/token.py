@@ -2,6 +2,8 @@ from .position import Position
 
 
 class Token:
+    __slots__ = ("type", "value", "position_start", "position_end")
+
     def __init__(
         self,
         _type: str,
@@ -13,11 +15,10 @@ class Token:
         self.value = value
 
         if position_start:
-            self.position_start = position_start.copy()
-            self.position_end = position_start.copy()
-            self.position_end.advance()
-        if position_end:
-            self.position_end = position_end.copy()
+            self.position_start = position_start
+            self.position_end = position_end or position_start.copy().advance()
+        elif position_end:
+            self.position_end = position_end
 
     def __repr__(self) -> str:
         if self.value:
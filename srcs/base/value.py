@@ -4,6 +4,8 @@ from ..errors.run_time_error import RunTimeError
 
 
 class Value:
+    __slots__ = ("position_start", "position_end", "context")
+
     def __init__(self) -> None:
         self.set_position()
         self.set_context()
@@ -19,7 +21,13 @@ class Value:
         self.context = context
         return self
 
-    def execute(self, arguments) -> tuple["Value", "RunTimeError"]:
+    def execute(
+        self,
+        arguments: list["Value"],
+        context: "Context" = None,
+        position_start: "Position" = None,
+        position_end: "Position" = None,
+    ) -> tuple["Value", "RunTimeError"]:
         return None, self.illegal_operation()
 
     def copy(self) -> None:
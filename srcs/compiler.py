@@ -0,0 +1,263 @@
+from .base.code import Code
+from .base.number import Number
+from .base.string import String
+from .base.constants.tokens import *
+from .base.constants.opcodes import *
+from .base.constants.scopes import *
+from .base.nodes.number_node import NumberNode
+from .base.nodes.string_node import StringNode
+from .base.nodes.list_node import ListNode
+from .base.nodes.unary_operation_node import UnaryOperationNode
+from .base.nodes.binary_operation_node import BinaryOperationNode
+from .base.nodes.variable_access_node import VariableAccessNode
+from .base.nodes.variable_assign_node import VariableAssignNode
+from .base.nodes.if_node import IfNode
+from .base.nodes.for_node import ForNode
+from .base.nodes.while_node import WhileNode
+from .base.nodes.function_definition_node import FunctionDefinitionNode
+from .base.nodes.function_call_node import FunctionCallNode
+from .base.nodes.return_node import ReturnNode
+from .base.nodes.continue_node import ContinueNode
+from .base.nodes.break_node import BreakNode
+from .node_visitor import NodeVisitor
+
+BINARY_OPCODES = {
+    TOKEN_PLUS: OP_ADD,
+    TOKEN_MINUS: OP_SUBTRACT,
+    TOKEN_MUL: OP_MULTIPLY,
+    TOKEN_DIV: OP_DIVIDE,
+    TOKEN_MOD: OP_MODULO,
+    TOKEN_POW: OP_POWER,
+    TOKEN_EEQ: OP_EQ,
+    TOKEN_NEQ: OP_NEQ,
+    TOKEN_LT: OP_LT,
+    TOKEN_LTE: OP_LTE,
+    TOKEN_GT: OP_GT,
+    TOKEN_GTE: OP_GTE,
+    KEYWORD_AND: OP_AND,
+    KEYWORD_OR: OP_OR,
+}
+
+
+class Compiler(NodeVisitor):
+    def __init__(self) -> None:
+        self.code: "Code" = None
+
+    def compile(self, node, name: str = "<program>") -> "Code":
+        self.code = Code(name)
+        self.visit(node)
+        self.code.emit(OP_HALT)
+        return self.code
+
+    def compile_function(self, node: "FunctionDefinitionNode") -> "Code":
+        self.code = Code(
+            node.token.value if node.token else "<anonymous>",
+            [argument.value for argument in node.arguments],
+            node.is_automatic_return,
+            node.layout,
+        )
+        if node.is_automatic_return:
+            self.visit(node.body)
+        else:
+            self.discard(node.body)
+            self.load_null()
+        self.code.emit(OP_HALT)
+        return self.code
+
+    def discard(self, node) -> None:
+        if isinstance(node, ListNode):
+            for element_node in node.element_nodes:
+                self.discard(element_node)
+            return
+        if isinstance(node, VariableAssignNode):
+            self.visit(node.value_node)
+            self.store(node, node.variable_name_token.value)
+            return
+        self.visit(node)
+        self.code.emit(OP_POP)
+
+    def store(self, node, name: str) -> None:
+        if node.depth == DEPTH_LOCAL:
+            self.code.emit(OP_STORE_LOCAL, node.slot)
+        else:
+            self.code.emit(OP_STORE_NAME, self.code.add_name(name))
+
+    def load_null(self) -> None:
+        self.code.emit(OP_LOAD_CONST, self.code.add_constant(Number.null))
+
+    def block(self, node, is_null: bool) -> None:
+        if is_null:
+            self.discard(node)
+            self.load_null()
+        else:
+            self.visit(node)
+
+    def visit_NumberNode(self, node: "NumberNode") -> None:
+        constant = Number(node.token.value).set_position(
+            node.position_start, node.position_end
+        )
+        self.code.emit(OP_LOAD_CONST, self.code.add_constant(constant))
+
+    def visit_StringNode(self, node: "StringNode") -> None:
+        constant = String(node.token.value).set_position(
+            node.position_start, node.position_end
+        )
+        self.code.emit(OP_LOAD_CONST, self.code.add_constant(constant))
+
+    def visit_ListNode(self, node: "ListNode") -> None:
+        if not node.is_used:
+            self.discard(node)
+            self.load_null()
+            return
+        for element_node in node.element_nodes:
+            self.visit(element_node)
+        self.code.emit(OP_BUILD_LIST, len(node.element_nodes))
+
+    def visit_UnaryOperationNode(self, node: "UnaryOperationNode") -> None:
+        self.visit(node.node)
+        if node.operator_token.type == TOKEN_MINUS:
+            self.code.emit(
+                OP_NEGATE, 0, node.node.position_start, node.node.position_end
+            )
+        elif node.operator_token.matches(TOKEN_KEYWORD, "not"):
+            self.code.emit(OP_NOT, 0, node.node.position_start, node.node.position_end)
+
+    def visit_BinaryOperationNode(self, node: "BinaryOperationNode") -> None:
+        self.visit(node.left_node)
+        self.visit(node.right_node)
+        operator_token = node.operator_token
+        opcode = BINARY_OPCODES[
+            (
+                operator_token.value
+                if operator_token.type == TOKEN_KEYWORD
+                else operator_token.type
+            )
+        ]
+        self.code.emit(
+            opcode, 0, node.right_node.position_start, node.right_node.position_end
+        )
+
+    def visit_VariableAccessNode(self, node: "VariableAccessNode") -> None:
+        if node.depth == DEPTH_LOCAL:
+            opcode, argument = OP_LOAD_LOCAL, node.slot
+        else:
+            opcode = OP_LOAD_GLOBAL if node.depth == DEPTH_GLOBAL else OP_LOAD_NAME
+            argument = self.code.add_name(node.variable_name_token.value)
+        self.code.emit(opcode, argument, node.position_start, node.position_end)
+
+    def visit_VariableAssignNode(self, node: "VariableAssignNode") -> None:
+        self.visit(node.value_node)
+        self.code.emit(OP_DUPLICATE)
+        self.store(node, node.variable_name_token.value)
+
+    def visit_IfNode(self, node: "IfNode") -> None:
+        end_jumps = []
+
+        for condition, expr, is_null in node.cases:
+            self.visit(condition)
+            next_case_jump = self.code.emit(OP_POP_JUMP_IF_FALSE)
+            self.block(expr, is_null)
+            end_jumps.append(self.code.emit(OP_JUMP))
+            self.code.patch(next_case_jump, self.code.offset())
+
+        if node.else_case:
+            expr, is_null = node.else_case
+            self.block(expr, is_null)
+        else:
+            self.load_null()
+
+        for end_jump in end_jumps:
+            self.code.patch(end_jump, self.code.offset())
+
+    def visit_ForNode(self, node: "ForNode") -> None:
+        is_null = node.is_null or not node.is_used
+        if not is_null:
+            self.code.emit(OP_BUILD_LIST, 0)
+
+        self.visit(node.start_value)
+        self.visit(node.end_value)
+        if node.increment_value:
+            self.visit(node.increment_value)
+        else:
+            self.code.emit(OP_LOAD_CONST, self.code.add_constant(Number(1)))
+
+        self.code.emit(OP_FOR_PREPARE)
+        setup_loop = self.code.emit(OP_SETUP_LOOP)
+        loop_start = self.code.offset()
+        exit_jump = self.code.emit(OP_FOR_ITERATE)
+        self.store(node, node.token.value)
+
+        if is_null:
+            self.discard(node.body)
+        else:
+            self.visit(node.body)
+            self.code.emit(OP_LIST_APPEND, 2)
+        self.code.emit(OP_JUMP, loop_start)
+
+        self.code.patch(exit_jump, self.code.offset())
+        self.code.patch(setup_loop, self.code.offset())
+        self.code.emit(OP_POP_BLOCK)
+        self.code.emit(OP_POP)
+
+        if is_null:
+            self.load_null()
+
+    def visit_WhileNode(self, node: "WhileNode") -> None:
+        is_null = node.is_null or not node.is_used
+        if not is_null:
+            self.code.emit(OP_BUILD_LIST, 0)
+
+        setup_loop = self.code.emit(OP_SETUP_LOOP)
+        loop_start = self.code.offset()
+        self.visit(node.condition)
+        exit_jump = self.code.emit(OP_POP_JUMP_IF_FALSE)
+
+        if is_null:
+            self.discard(node.body)
+        else:
+            self.visit(node.body)
+            self.code.emit(OP_LIST_APPEND, 1)
+        self.code.emit(OP_JUMP, loop_start)
+
+        self.code.patch(exit_jump, self.code.offset())
+        self.code.patch(setup_loop, self.code.offset())
+        self.code.emit(OP_POP_BLOCK)
+
+        if is_null:
+            self.load_null()
+
+    def visit_FunctionDefinitionNode(self, node: "FunctionDefinitionNode") -> None:
+        function_code = Compiler().compile_function(node)
+        self.code.emit(
+            OP_MAKE_FUNCTION,
+            self.code.add_constant(function_code),
+            node.position_start,
+            node.position_end,
+        )
+        if node.token:
+            self.code.emit(OP_DUPLICATE)
+            self.store(node, node.token.value)
+
+    def visit_FunctionCallNode(self, node: "FunctionCallNode") -> None:
+        self.visit(node.node_to_call)
+        for argument_node in node.arguments:
+            self.visit(argument_node)
+        self.code.emit(
+            OP_TAIL_CALL if node.is_tail else OP_CALL,
+            len(node.arguments),
+            node.position_start,
+            node.position_end,
+        )
+
+    def visit_ReturnNode(self, node: "ReturnNode") -> None:
+        if node.to_return:
+            self.visit(node.to_return)
+        else:
+            self.load_null()
+        self.code.emit(OP_RETURN_VALUE)
+
+    def visit_ContinueNode(self, _: "ContinueNode") -> None:
+        self.code.emit(OP_CONTINUE_LOOP)
+
+    def visit_BreakNode(self, _: "BreakNode") -> None:
+        self.code.emit(OP_BREAK_LOOP)
@@ -0,0 +1,81 @@
+from threading import Lock
+from typing import Callable, TextIO
+from .module_registry import ModuleRegistry
+from .base.symbol_table import SymbolTable
+from .base.number import Number
+from .base.value import Value
+from .base.forked_list import ForkedList
+from .base.functions.builtin_function import BuiltInFunction
+from .base.functions.native_function import NativeFunction
+
+
+class Environment:
+    root: "Environment" = None
+
+    def __init__(
+        self,
+        symbol_table: "SymbolTable" = None,
+        modules: "ModuleRegistry" = None,
+        output: "TextIO" = None,
+        input: "TextIO" = None,
+    ) -> None:
+        self.symbol_table = symbol_table or SymbolTable()
+        self.modules = modules or ModuleRegistry()
+        self.output = output
+        self.input = input
+        self.lock = Lock()
+
+    @classmethod
+    def create_root(cls) -> "Environment":
+        environment = cls()
+        environment.define("null", Number.null)
+        environment.define("false", Number.false)
+        environment.define("true", Number.true)
+        environment.define("PI", Number.PI)
+        for name in BuiltInFunction.methods:
+            environment.define(name, getattr(BuiltInFunction, name))
+        return environment
+
+    def define(self, name: str, value: any) -> None:
+        if callable(value) and not isinstance(value, Value):
+            value = NativeFunction(name, value)
+        self.symbol_table.set(name, NativeFunction.to_value(value))
+
+    def register(self, function: "Callable", name: str = None) -> "Callable":
+        self.define(name or function.__name__, function)
+        return function
+
+    def get(self, name: str) -> any:
+        return NativeFunction.to_python(self.symbol_table.get(name))
+
+    @staticmethod
+    def share(
+        names: dict[str, any],
+        copies: tuple[dict, "Lock"],
+        parent_copies: tuple[dict, "Lock"],
+    ) -> dict[str, any]:
+        forked = {}
+        for name, value in names.items():
+            forked[name] = ForkedList.of(value, *copies)
+            names[name] = ForkedList.of(value, *parent_copies)
+        return forked
+
+    def fork(self, output: "TextIO" = None, input: "TextIO" = None) -> "Environment":
+        copies, parent_copies = ({}, Lock()), ({}, Lock())
+        with self.lock:
+            symbol_table = SymbolTable()
+            symbol_table.table = self.share(
+                self.symbol_table.table, copies, parent_copies
+            )
+            symbol_table.bound_names = self.symbol_table.bound_names.copy()
+            modules = ModuleRegistry()
+            modules.namespaces = {
+                path: self.share(names, copies, parent_copies)
+                for path, names in self.modules.namespaces.items()
+            }
+        return Environment(
+            symbol_table, modules, output or self.output, input or self.input
+        )
+
+
+Environment.root = Environment.create_root()
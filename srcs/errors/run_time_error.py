@@ -23,14 +23,30 @@ class RunTimeError(BaseError):
         return result
 
     def generate_traceback(self) -> str:
-        result = ""
+        lines = []
         position = self.position_start
         context = self.context
         while context:
-            result = (
+            lines.append(
                 f"  File {position.file_name}, line {position.line + 1}, in {context.display_name}\n"
-                + result
             )
             position = context.parent_entry_position
             context = context.parent
+
+        result = ""
+        previous = None
+        repeated = 0
+        for line in reversed(lines):
+            if line == previous:
+                repeated += 1
+                if repeated > 2:
+                    continue
+            else:
+                if repeated > 2:
+                    result += f"  [Previous line repeated {repeated - 2} more times]\n"
+                previous = line
+                repeated = 0
+            result += line
+        if repeated > 2:
+            result += f"  [Previous line repeated {repeated - 2} more times]\n"
         return "Traceback (most recent call last):\n" + result
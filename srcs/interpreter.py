@@ -1,3 +1,4 @@
+from typing import Callable
 from .base.context import Context
 from .base.nodes.number_node import NumberNode
 from .base.run_time_result import RunTimeResult
@@ -18,45 +19,105 @@ from .base.nodes.string_node import StringNode
 from .base.string import String
 from .base.nodes.list_node import ListNode
 from .base.list import List
+from .base.lazy_list import LazyList
+from .base.symbol_table import SymbolTable
 from .base.nodes.return_node import ReturnNode
 from .base.nodes.continue_node import ContinueNode
 from .base.nodes.break_node import BreakNode
+from .base.value import Value
+from .base.signals.return_signal import ReturnSignal
+from .base.signals.continue_signal import ContinueSignal
+from .base.signals.break_signal import BreakSignal
+from .base.signals.error_signal import ErrorSignal
+from .base.signals.tail_call_signal import TailCallSignal
+from .node_visitor import NodeVisitor
 
 
-class Interpreter:
+class Interpreter(NodeVisitor):
     def __init__(self) -> None:
         pass
 
-    def visit(self, node, context: "Context") -> "Number":
-        method_name = f"visit_{type(node).__name__}"
-        method = getattr(self, method_name, self.no_visit_method)
-        return method(node, context)
+    def visit(self, node, context: "Context") -> "RunTimeResult":
+        response = RunTimeResult()
+        try:
+            return response.success(self.evaluate(node, context))
+        except ReturnSignal as signal:
+            return response.success_return(signal.value)
+        except ContinueSignal:
+            return response.success_continue()
+        except BreakSignal:
+            return response.success_break()
+        except ErrorSignal as signal:
+            return response.failure(signal.error)
+
+    def call(self, function: "Function", context: "Context") -> "RunTimeResult":
+        while True:
+            try:
+                return self.visit(function.body_node, context)
+            except TailCallSignal as signal:
+                if signal.function is not function or len(signal.arguments) != len(
+                    function.argument_names
+                ):
+                    response = RunTimeResult()
+                    value = response.register(
+                        signal.function.execute(
+                            signal.arguments,
+                            context,
+                            signal.position_start,
+                            signal.position_end,
+                        )
+                    )
+                    if response.should_return():
+                        return response
+                    return response.success_return(value)
+                function.populate_arguments(
+                    function.argument_names, signal.arguments, context
+                )
 
-    def no_visit_method(self, node, context: "Context") -> None:
-        raise Exception(f"No visit_{type(node).__name__} method defined")
+    def evaluate(self, node, context: "Context") -> "Value":
+        method = self.dispatch_table.get(type(node))
+        if method is None:
+            return self.no_visit_method(node, context)
+        return method(self, node, context)
+
+    def anchor(self, error: "RunTimeError", node, context: "Context") -> "ErrorSignal":
+        error.position_start = node.position_start
+        error.position_end = node.position_end
+        error.context = context
+        return ErrorSignal(error)
+
+    def unwrap(self, result: "RunTimeResult") -> "Value":
+        if result.error:
+            raise ErrorSignal(result.error)
+        if result.continue_loop:
+            raise ContinueSignal()
+        if result.break_loop:
+            raise BreakSignal()
+        return result.value
 
     def visit_NumberNode(self, node: "NumberNode", context: "Context") -> "Number":
-        return RunTimeResult().success(
-            Number(node.token.value)
-            .set_context(context)
-            .set_position(node.position_start, node.position_end)
-        )
+        if node.value is None:
+            node.value = Number(node.token.value).set_position(
+                node.position_start, node.position_end
+            )
+        return node.value
 
     def visit_StringNode(self, node: "StringNode", context: "Context") -> "String":
-        return RunTimeResult().success(
-            String(node.token.value)
-            .set_context(context)
-            .set_position(node.position_start, node.position_end)
-        )
-
-    def visit_ListNode(self, node: "ListNode", context: "Context") -> "List":
-        response = RunTimeResult()
-        elements = []
-        for element_node in node.element_nodes:
-            elements.append(response.register(self.visit(element_node, context)))
-            if response.should_return():
-                return response
-        return response.success(
+        if node.value is None:
+            node.value = String(node.token.value).set_position(
+                node.position_start, node.position_end
+            )
+        return node.value
+
+    def visit_ListNode(self, node: "ListNode", context: "Context") -> "Value":
+        if not node.is_used:
+            for element_node in node.element_nodes:
+                self.evaluate(element_node, context)
+            return Number.null
+        elements = [
+            self.evaluate(element_node, context) for element_node in node.element_nodes
+        ]
+        return (
             List(elements)
             .set_context(context)
             .set_position(node.position_start, node.position_end)
@@ -65,33 +126,23 @@ class Interpreter:
     def visit_UnaryOperationNode(
         self, node: "UnaryOperationNode", context: "Context"
     ) -> "Number":
-        response = RunTimeResult()
-        number = response.register(self.visit(node.node, context))
-        if response.should_return():
-            return response
+        number = self.evaluate(node.node, context)
 
         error = None
         if node.operator_token.type == TOKEN_MINUS:
-            number, error = number.multiplied_by(Number(-1))
+            number, error = number.multiplied_by(Number.of(-1))
         elif node.operator_token.matches(TOKEN_KEYWORD, "not"):
             number, error = number.notted()
 
         if error:
-            return response.failure(error)
-        return response.success(
-            number.set_position(node.position_start, node.position_end)
-        )
+            raise self.anchor(error, node.node, context)
+        return number
 
     def visit_BinaryOperationNode(
         self, node: "BinaryOperationNode", context: "Context"
     ) -> "Number":
-        response = RunTimeResult()
-        left_node: "Number" = response.register(self.visit(node.left_node, context))
-        if response.should_return():
-            return response
-        right_node: "Number" = response.register(self.visit(node.right_node, context))
-        if response.should_return():
-            return response
+        left_node: "Number" = self.evaluate(node.left_node, context)
+        right_node: "Number" = self.evaluate(node.right_node, context)
 
         if node.operator_token.type == TOKEN_PLUS:
             result, error = left_node.added_to(right_node)
@@ -123,19 +174,16 @@ class Interpreter:
             result, error = left_node.ored_by(right_node)
 
         if error:
-            return response.failure(error)
-        return response.success(
-            result.set_position(node.position_start, node.position_end)
-        )
+            raise self.anchor(error, node.right_node, context)
+        return result
 
     def visit_VariableAccessNode(
         self, node: "VariableAccessNode", context: "Context"
-    ) -> "RunTimeResult":
-        response = RunTimeResult()
+    ) -> "Value":
         variable_name = node.variable_name_token.value
-        value = context.symbol_table.get(variable_name)
+        value = context.symbol_table.lookup(variable_name, node.depth, node.slot)
         if not value:
-            return response.failure(
+            raise ErrorSignal(
                 RunTimeError(
                     node.position_start,
                     node.position_end,
@@ -143,138 +191,147 @@ class Interpreter:
                     context,
                 )
             )
-        value = (
-            value.copy()
-            .set_position(node.position_start, node.position_end)
-            .set_context(context)
-        )
-        return response.success(value)
+        return value
 
     def visit_VariableAssignNode(
         self, node: "VariableAssignNode", context: "Context"
-    ) -> float:
-        response = RunTimeResult()
+    ) -> "Value":
         variable_name = node.variable_name_token.value
-        value = response.register(self.visit(node.value_node, context))
-        if response.should_return():
-            return response
-        context.symbol_table.set(variable_name, value)
-        return response.success(value)
-
-    def visit_IfNode(self, node: "IfNode", context: "Context") -> "RunTimeResult":
-        response = RunTimeResult()
+        value = self.evaluate(node.value_node, context)
+        context.symbol_table.assign(variable_name, value, node.depth, node.slot)
+        return value
 
+    def visit_IfNode(self, node: "IfNode", context: "Context") -> "Value":
         for condition, expr, is_null in node.cases:
-            condition_value = response.register(self.visit(condition, context))
-            if response.should_return():
-                return response
+            condition_value = self.evaluate(condition, context)
             if condition_value.is_true():
-                expr_value = response.register(self.visit(expr, context))
-                if response.should_return():
-                    return response
-                return response.success(Number.null if is_null else expr_value)
+                expr_value = self.evaluate(expr, context)
+                return Number.null if is_null else expr_value
 
         if node.else_case:
             expr, is_null = node.else_case
-            else_value = response.register(self.visit(expr, context))
-            if response.should_return():
-                return response
-            return response.success(Number.null if is_null else else_value)
-
-        return response.success(Number.null)
-
-    def visit_ForNode(self, node: "ForNode", context: "Context") -> "RunTimeResult":
-        response = RunTimeResult()
-        elements = []
-
-        start_value: "Number" = response.register(self.visit(node.start_value, context))
-        if response.should_return():
-            return response
+            else_value = self.evaluate(expr, context)
+            return Number.null if is_null else else_value
 
-        end_value: "Number" = response.register(self.visit(node.end_value, context))
-        if response.should_return():
-            return response
+        return Number.null
 
+    def visit_ForNode(self, node: "ForNode", context: "Context") -> "Value":
+        start_value: "Number" = self.evaluate(node.start_value, context)
+        end_value: "Number" = self.evaluate(node.end_value, context)
         if node.increment_value:
-            increment_value: "Number" = response.register(
-                self.visit(node.increment_value, context)
-            )
-            if response.should_return():
-                return response
+            increment_value: "Number" = self.evaluate(node.increment_value, context)
         else:
-            increment_value = Number(1)
-
-        i = start_value.value
-
-        if increment_value.value >= 0:
-            condition = lambda: i <= end_value.value
+            increment_value = Number.of(1)
+
+        start = start_value.value
+        end = end_value.value
+        increment = increment_value.value
+        if type(start) is int and type(end) is int and type(increment) is int:
+            if increment > 0:
+                indexes = range(start, end + 1, increment)
+            elif increment < 0:
+                indexes = range(start, end - 1, increment)
+            else:
+                indexes = self.count(start, end, increment)
         else:
-            condition = lambda: i >= end_value.value
-
-        while condition():
-            context.symbol_table.set(node.token.value, Number(i))
-            i += increment_value.value
-
-            value = response.register(self.visit(node.body, context))
-            if (
-                response.should_return()
-                and not response.continue_loop
-                and not response.break_loop
-            ):
-                return response
-            if response.continue_loop:
+            indexes = self.count(start, end, increment)
+
+        assign = context.symbol_table.assign
+        name = node.token.value
+        body = node.body
+        if node.is_lazy and type(indexes) is range:
+            if indexes:
+                assign(name, Number.of(indexes[-1]), node.depth, node.slot)
+            return (
+                LazyList(indexes, self.element(name, body))
+                .set_context(context)
+                .set_position(node.position_start, node.position_end)
+            )
+        number = Number.of
+        if node.is_null or not node.is_used:
+            body = body.element_nodes if type(body) is ListNode else [body]
+            for i in indexes:
+                assign(name, number(i), node.depth, node.slot)
+                try:
+                    for statement in body:
+                        self.evaluate(statement, context)
+                except ContinueSignal:
+                    continue
+                except BreakSignal:
+                    break
+            return Number.null
+
+        elements = []
+        for i in indexes:
+            assign(name, number(i), node.depth, node.slot)
+            try:
+                value = self.evaluate(body, context)
+            except ContinueSignal:
                 continue
-            if response.break_loop:
+            except BreakSignal:
                 break
-
             elements.append(value)
 
-        return response.success(
-            Number.null
-            if node.is_null
-            else List(elements)
+        return (
+            List(elements)
             .set_context(context)
             .set_position(node.position_start, node.position_end)
         )
 
-    def visit_WhileNode(self, node: "WhileNode", context: "Context") -> "RunTimeResult":
-        response = RunTimeResult()
-        elements = []
-
-        while True:
-            condition: "Number" = response.register(self.visit(node.condition, context))
-            if response.should_return():
-                return response
-
-            if not condition.is_true():
-                break
+    def element(self, name: str, body) -> Callable[[int], "Value"]:
+        def element(i: int) -> "Value":
+            context = Context("<lazy>")
+            context.symbol_table = SymbolTable()
+            context.symbol_table.set(name, Number.of(i))
+            return self.evaluate(body, context)
+
+        return element
+
+    def count(self, start: float, end: float, increment: float):
+        i = start
+        if increment >= 0:
+            while i <= end:
+                yield i
+                i += increment
+        else:
+            while i >= end:
+                yield i
+                i += increment
+
+    def visit_WhileNode(self, node: "WhileNode", context: "Context") -> "Value":
+        condition_node = node.condition
+        body = node.body
+        if node.is_null or not node.is_used:
+            body = body.element_nodes if type(body) is ListNode else [body]
+            while self.evaluate(condition_node, context).is_true():
+                try:
+                    for statement in body:
+                        self.evaluate(statement, context)
+                except ContinueSignal:
+                    continue
+                except BreakSignal:
+                    break
+            return Number.null
 
-            value = response.register(self.visit(node.body, context))
-            if (
-                response.should_return()
-                and not response.continue_loop
-                and not response.break_loop
-            ):
-                return response
-            if response.continue_loop:
+        elements = []
+        while self.evaluate(condition_node, context).is_true():
+            try:
+                value = self.evaluate(body, context)
+            except ContinueSignal:
                 continue
-            if response.break_loop:
+            except BreakSignal:
                 break
-
             elements.append(value)
 
-        return response.success(
-            Number.null
-            if node.is_null
-            else List(elements)
+        return (
+            List(elements)
             .set_context(context)
             .set_position(node.position_start, node.position_end)
         )
 
     def visit_FunctionDefinitionNode(
         self, node: "FunctionDefinitionNode", context: "Context"
-    ) -> "RunTimeResult":
-        response = RunTimeResult()
+    ) -> "Function":
         function_name = node.token.value if node.token else None
         function_body = node.body
         function_arguments = [argument.value for argument in node.arguments]
@@ -284,57 +341,43 @@ class Interpreter:
                 function_body,
                 function_arguments,
                 node.is_automatic_return,
+                layout=node.layout,
             )
             .set_context(context)
             .set_position(node.position_start, node.position_end)
         )
         if node.token:
-            context.symbol_table.set(function_name, function_value)
-        return response.success(function_value)
+            context.symbol_table.assign(
+                function_name, function_value, node.depth, node.slot
+            )
+        return function_value
 
     def visit_FunctionCallNode(
         self, node: "FunctionCallNode", context: "Context"
-    ) -> "RunTimeResult":
-        response = RunTimeResult()
-        arguments = []
-        value_to_call: "Function" = response.register(
-            self.visit(node.node_to_call, context)
-        )
-        if response.should_return():
-            return response
-        value_to_call = value_to_call.copy().set_position(
-            node.position_start, node.position_end
-        )
-        for argument_node in node.arguments:
-            arguments.append(response.register(self.visit(argument_node, context)))
-            if response.should_return():
-                return response
-        return_value = response.register(value_to_call.execute(arguments))
-        if response.should_return():
-            return response
-        return_value = (
-            return_value.copy()
-            .set_position(node.position_start, node.position_end)
-            .set_context(context)
+    ) -> "Value":
+        value_to_call: "Function" = self.evaluate(node.node_to_call, context)
+        arguments = [
+            self.evaluate(argument_node, context) for argument_node in node.arguments
+        ]
+        if node.is_tail:
+            raise TailCallSignal(
+                value_to_call, arguments, node.position_start, node.position_end
+            )
+        return self.unwrap(
+            value_to_call.execute(
+                arguments, context, node.position_start, node.position_end
+            )
         )
-        return response.success(return_value)
-
-    def visit_ReturnNode(
-        self, node: "ReturnNode", context: "Context"
-    ) -> "RunTimeResult":
-        response = RunTimeResult()
 
+    def visit_ReturnNode(self, node: "ReturnNode", context: "Context") -> None:
         if node.to_return:
-            value = response.register(self.visit(node.to_return, context))
-            if response.should_return():
-                return response
+            value = self.evaluate(node.to_return, context)
         else:
             value = Number.null
+        raise ReturnSignal(value)
 
-        return response.success_return(value)
-
-    def visit_ContinueNode(self, _: "ContinueNode", __: "Context") -> "RunTimeResult":
-        return RunTimeResult().success_continue()
+    def visit_ContinueNode(self, _: "ContinueNode", __: "Context") -> None:
+        raise ContinueSignal()
 
-    def visit_BreakNode(self, _: "BreakNode", __: "Context") -> "RunTimeResult":
-        return RunTimeResult().success_break()
+    def visit_BreakNode(self, _: "BreakNode", __: "Context") -> None:
+        raise BreakSignal()
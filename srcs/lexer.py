@@ -1,103 +1,128 @@
+from typing import Iterator, TextIO
 from .base.position import Position
+from .base.source import Source
 from .base.token import Token
 from .base.constants.tokens import *
+from .base.constants.limits import CHUNK_SIZE
 from .errors.base_error import BaseError
 from .errors.illegal_character_error import IllegalCharacterError
 from .errors.expected_character_error import ExpectedCharacterError
 
 
 class Lexer:
-    def __init__(self, file_name: str, text: str) -> None:
+    def __init__(self, file_name: str, text: str = "", stream: "TextIO" = None) -> None:
         self.file_name = file_name
         self.text = text
-        self.position = Position(-1, 0, -1, self.file_name, self.text)
+        self.length = len(text)
+        self.stream = stream
+        self.offset = 0
+        self.error = None
+        self.position = Position(-1, Source(self.file_name, self.text))
         self.current_character = None
 
         self.advance()
 
     def advance(self) -> None:
         self.position.advance(self.current_character)
-        self.current_character = (
-            self.text[self.position.index]
-            if self.position.index < len(self.text)
-            else None
-        )
+        index = self.position.index - self.offset
+        if index < self.length:
+            self.current_character = self.text[index]
+        elif self.stream and self.read():
+            self.current_character = self.text[0]
+        else:
+            self.current_character = None
+
+    def read(self) -> bool:
+        chunk = self.stream.read(CHUNK_SIZE)
+        if not chunk:
+            self.stream = None
+            return False
+        self.position.source.append(chunk)
+        self.text = chunk
+        self.length = len(chunk)
+        self.offset = self.position.index
+        return True
 
     def make_tokens(self) -> tuple[list["Token"], BaseError]:
-        tokens = []
+        tokens = list(self.generate_tokens())
+        if self.error:
+            return [], self.error
+        return tokens, None
 
+    def generate_tokens(self) -> Iterator["Token"]:
         while self.current_character:
             if self.current_character in " \t":
                 self.advance()
             elif self.current_character == "#":
                 self.advance()
-                while not self.current_character in ";\n":
+                while self.current_character and self.current_character not in ";\n":
                     self.advance()
-                tokens.append(Token(TOKEN_NEWLINE, position_start=self.position))
-                self.advance()
             elif self.current_character in ";\n":
-                tokens.append(Token(TOKEN_NEWLINE, position_start=self.position))
+                yield Token(TOKEN_NEWLINE, position_start=self.position.copy())
                 self.advance()
             elif self.current_character in NUMERIC:
-                tokens.append(self.make_number())
+                yield self.make_number()
             elif self.current_character in ALPHABETIC:
-                tokens.append(self.make_identifier())
+                yield self.make_identifier()
             elif self.current_character == '"':
-                tokens.append(self.make_string())
+                yield self.make_string()
             elif self.current_character == "+":
-                tokens.append(Token(TOKEN_PLUS, position_start=self.position))
+                yield Token(TOKEN_PLUS, position_start=self.position.copy())
                 self.advance()
             elif self.current_character == "-":
-                tokens.append(Token(TOKEN_MINUS, position_start=self.position))
+                yield Token(TOKEN_MINUS, position_start=self.position.copy())
                 self.advance()
             elif self.current_character == "*":
-                tokens.append(Token(TOKEN_MUL, position_start=self.position))
+                yield Token(TOKEN_MUL, position_start=self.position.copy())
                 self.advance()
             elif self.current_character == "/":
-                tokens.append(Token(TOKEN_DIV, position_start=self.position))
+                yield Token(TOKEN_DIV, position_start=self.position.copy())
                 self.advance()
             elif self.current_character == "%":
-                tokens.append(Token(TOKEN_MOD, position_start=self.position))
+                yield Token(TOKEN_MOD, position_start=self.position.copy())
                 self.advance()
             elif self.current_character == "^":
-                tokens.append(Token(TOKEN_POW, position_start=self.position))
+                yield Token(TOKEN_POW, position_start=self.position.copy())
                 self.advance()
             elif self.current_character == "(":
-                tokens.append(Token(TOKEN_LPAREN, position_start=self.position))
+                yield Token(TOKEN_LPAREN, position_start=self.position.copy())
                 self.advance()
             elif self.current_character == ")":
-                tokens.append(Token(TOKEN_RPAREN, position_start=self.position))
+                yield Token(TOKEN_RPAREN, position_start=self.position.copy())
                 self.advance()
             elif self.current_character == "[":
-                tokens.append(Token(TOKEN_LSQUARE, position_start=self.position))
+                yield Token(TOKEN_LSQUARE, position_start=self.position.copy())
                 self.advance()
             elif self.current_character == "]":
-                tokens.append(Token(TOKEN_RSQUARE, position_start=self.position))
+                yield Token(TOKEN_RSQUARE, position_start=self.position.copy())
                 self.advance()
             elif self.current_character == "!":
                 token, error = self.make_not_equals()
                 if error:
-                    return [], error
-                tokens.append(token)
+                    self.error = error
+                    yield Token(TOKEN_EOF, position_start=error.position_start)
+                    return
+                yield token
             elif self.current_character == "=":
-                tokens.append(self.make_equals())
+                yield self.make_equals()
             elif self.current_character == "<":
-                tokens.append(self.make_less_than())
+                yield self.make_less_than()
             elif self.current_character == ">":
-                tokens.append(self.make_greater_than())
+                yield self.make_greater_than()
             elif self.current_character == ",":
-                tokens.append(Token(TOKEN_COMMA, position_start=self.position))
+                yield Token(TOKEN_COMMA, position_start=self.position.copy())
                 self.advance()
             else:
                 position_start = self.position.copy()
                 char = self.current_character
                 self.advance()
-                return [], IllegalCharacterError(
+                self.error = IllegalCharacterError(
                     position_start, self.position, f"'{char}'"
                 )
+                yield Token(TOKEN_EOF, position_start=position_start)
+                return
 
-        tokens.append(Token(TOKEN_EOF, position_start=self.position))
-        return tokens, None
+        yield Token(TOKEN_EOF, position_start=self.position.copy())
 
     def make_number(self) -> "Token":
         number_string = ""
@@ -115,8 +140,12 @@ class Lexer:
             self.advance()
 
         if dot_count == 0:
-            return Token(TOKEN_INT, int(number_string), position_start, self.position)
-        return Token(TOKEN_FLOAT, float(number_string), position_start, self.position)
+            return Token(
+                TOKEN_INT, int(number_string), position_start, self.position.copy()
+            )
+        return Token(
+            TOKEN_FLOAT, float(number_string), position_start, self.position.copy()
+        )
 
     def make_identifier(self) -> "Token":
         identifier_string = ""
@@ -130,7 +159,9 @@ class Lexer:
             TOKEN_KEYWORD if identifier_string in KEYWORDS else TOKEN_IDENTIFIER
         )
 
-        return Token(token_type, identifier_string, position_start, self.position)
+        return Token(
+            token_type, identifier_string, position_start, self.position.copy()
+        )
 
     def make_string(self) -> "Token":
         string = ""
@@ -159,7 +190,7 @@ class Lexer:
             escape_character = False
 
         self.advance()
-        return Token(TOKEN_STRING, string, position_start, self.position)
+        return Token(TOKEN_STRING, string, position_start, self.position.copy())
 
     def make_not_equals(self) -> tuple["Token", BaseError]:
         position_start = self.position.copy()
@@ -169,7 +200,9 @@ class Lexer:
             self.advance()
             return (
                 Token(
-                    TOKEN_NEQ, position_start=position_start, position_end=self.position
+                    TOKEN_NEQ,
+                    position_start=position_start,
+                    position_end=self.position.copy(),
                 ),
                 None,
             )
@@ -192,7 +225,7 @@ class Lexer:
             token_type = TOKEN_ARROW
 
         return Token(
-            token_type, position_start=position_start, position_end=self.position
+            token_type, position_start=position_start, position_end=self.position.copy()
         )
 
     def make_greater_than(self) -> "Token":
@@ -205,7 +238,7 @@ class Lexer:
             token_type = TOKEN_GTE
 
         return Token(
-            token_type, position_start=position_start, position_end=self.position
+            token_type, position_start=position_start, position_end=self.position.copy()
         )
 
     def make_less_than(self) -> "Token":
@@ -218,5 +251,5 @@ class Lexer:
             token_type = TOKEN_LTE
 
         return Token(
-            token_type, position_start=position_start, position_end=self.position
+            token_type, position_start=position_start, position_end=self.position.copy()
         )
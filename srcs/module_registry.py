@@ -0,0 +1,41 @@
+import os
+from .base.value import Value
+
+
+class ModuleRegistry:
+    def __init__(self) -> None:
+        self.namespaces: dict[str, dict[str, "Value"]] = {}
+        self.loading: list[str] = []
+        self.assigned: list[set[str]] = []
+
+    def path(self, file_name: str) -> str:
+        return os.path.abspath(file_name)
+
+    def get(self, file_name: str) -> dict[str, "Value"]:
+        return self.namespaces.get(self.path(file_name))
+
+    def cycle(self, file_name: str) -> list[str]:
+        path = self.path(file_name)
+        if path not in self.loading:
+            return None
+        return self.loading[self.loading.index(path) :] + [path]
+
+    def begin(self, file_name: str) -> None:
+        self.loading.append(self.path(file_name))
+        self.assigned.append(set())
+
+    def end(self) -> set[str]:
+        self.loading.pop()
+        return self.assigned.pop()
+
+    def record(self, names: set[str]) -> None:
+        if self.assigned:
+            self.assigned[-1].update(names)
+
+    def store(self, file_name: str, names: set[str], table: dict[str, "Value"]) -> None:
+        namespace = {name: table[name] for name in names if name in table}
+        self.namespaces[self.path(file_name)] = namespace
+        self.record(namespace)
+
+    def remove(self, file_name: str) -> None:
+        self.namespaces.pop(self.path(file_name), None)
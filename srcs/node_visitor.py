@@ -0,0 +1,55 @@
+from typing import Callable
+from .base.nodes.number_node import NumberNode
+from .base.nodes.string_node import StringNode
+from .base.nodes.list_node import ListNode
+from .base.nodes.unary_operation_node import UnaryOperationNode
+from .base.nodes.binary_operation_node import BinaryOperationNode
+from .base.nodes.variable_access_node import VariableAccessNode
+from .base.nodes.variable_assign_node import VariableAssignNode
+from .base.nodes.if_node import IfNode
+from .base.nodes.for_node import ForNode
+from .base.nodes.while_node import WhileNode
+from .base.nodes.function_definition_node import FunctionDefinitionNode
+from .base.nodes.function_call_node import FunctionCallNode
+from .base.nodes.return_node import ReturnNode
+from .base.nodes.continue_node import ContinueNode
+from .base.nodes.break_node import BreakNode
+
+NODE_CLASSES = (
+    NumberNode,
+    StringNode,
+    ListNode,
+    UnaryOperationNode,
+    BinaryOperationNode,
+    VariableAccessNode,
+    VariableAssignNode,
+    IfNode,
+    ForNode,
+    WhileNode,
+    FunctionDefinitionNode,
+    FunctionCallNode,
+    ReturnNode,
+    ContinueNode,
+    BreakNode,
+)
+
+
+class NodeVisitor:
+    dispatch_table: dict[type, "Callable"] = {}
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.dispatch_table = {
+            node_class: getattr(cls, f"visit_{node_class.__name__}")
+            for node_class in NODE_CLASSES
+            if hasattr(cls, f"visit_{node_class.__name__}")
+        }
+
+    def visit(self, node):
+        method = self.dispatch_table.get(type(node))
+        if method is None:
+            return self.no_visit_method(node)
+        return method(self, node)
+
+    def no_visit_method(self, node, *_) -> None:
+        raise Exception(f"No visit_{type(node).__name__} method defined")
@@ -0,0 +1,256 @@
+from .base.token import Token
+from .base.value import Value
+from .base.number import Number
+from .base.string import String
+from .base.symbol_table import SymbolTable
+from .base.constants.tokens import *
+from .base.constants.opcodes import BINARY_OPERATIONS
+from .compiler import BINARY_OPCODES
+from .base.nodes.number_node import NumberNode
+from .base.nodes.string_node import StringNode
+from .base.nodes.list_node import ListNode
+from .base.nodes.unary_operation_node import UnaryOperationNode
+from .base.nodes.binary_operation_node import BinaryOperationNode
+from .base.nodes.variable_access_node import VariableAccessNode
+from .base.nodes.variable_assign_node import VariableAssignNode
+from .base.nodes.if_node import IfNode
+from .base.nodes.for_node import ForNode
+from .base.nodes.while_node import WhileNode
+from .base.nodes.function_definition_node import FunctionDefinitionNode
+from .base.nodes.function_call_node import FunctionCallNode
+from .base.nodes.return_node import ReturnNode
+from .base.nodes.continue_node import ContinueNode
+from .base.nodes.break_node import BreakNode
+from .node_visitor import NodeVisitor
+
+CONSTANT_NAMES = ("null", "false", "true", "PI")
+MAX_FOLDED_EXPONENT = 64
+MAX_FOLDED_STRING_LENGTH = 1024
+
+
+class Optimizer(NodeVisitor):
+    def __init__(
+        self,
+        level: int = 1,
+        symbol_table: "SymbolTable" = None,
+        declared_names: set[str] = None,
+    ) -> None:
+        self.level = level
+        self.constants = {}
+        self.report: list[str] = []
+        if level >= 2 and symbol_table:
+            for name in CONSTANT_NAMES:
+                value = symbol_table.get(name)
+                if name not in (declared_names or ()) and type(value) is Number:
+                    self.constants[name] = value
+
+    def optimize(self, node):
+        if self.level <= 0:
+            return node
+        return self.visit(node)
+
+    def note(self, node, message: str) -> None:
+        position_start = node.position_start
+        self.report.append(
+            f"{position_start.file_name}:{position_start.line + 1}: {message}"
+        )
+
+    def source(self, node) -> str:
+        return node.position_start.file_text[
+            node.position_start.index : node.position_end.index
+        ]
+
+    def literal(self, node) -> "Value":
+        if type(node) is NumberNode:
+            return Number(node.token.value)
+        if type(node) is StringNode:
+            return String(node.token.value)
+        return None
+
+    def fold(self, node, value: "Value"):
+        if type(value) is String:
+            folded = StringNode(
+                Token(TOKEN_STRING, value.value, node.position_start, node.position_end)
+            )
+        else:
+            folded = NumberNode(
+                Token(
+                    TOKEN_FLOAT if isinstance(value.value, float) else TOKEN_INT,
+                    value.value,
+                    node.position_start,
+                    node.position_end,
+                )
+            )
+        self.note(node, f"folded '{self.source(node)}' to {value!r}")
+        return folded
+
+    def is_foldable(self, opcode: int, left: "Value", right: "Value") -> bool:
+        if type(left) is Number:
+            if type(right) is not Number:
+                return False
+            if opcode == BINARY_OPCODES[TOKEN_POW]:
+                return (
+                    type(left.value) is int
+                    and type(right.value) is int
+                    and 0 <= right.value <= MAX_FOLDED_EXPONENT
+                )
+            return True
+        if type(right) is Number:
+            return (
+                opcode == BINARY_OPCODES[TOKEN_MUL]
+                and type(right.value) is int
+                and len(left.value) * right.value <= MAX_FOLDED_STRING_LENGTH
+            )
+        return len(left.value) + len(right.value) <= MAX_FOLDED_STRING_LENGTH
+
+    def visit_NumberNode(self, node: "NumberNode"):
+        return node
+
+    def visit_StringNode(self, node: "StringNode"):
+        return node
+
+    def visit_ListNode(self, node: "ListNode"):
+        node.element_nodes = [
+            self.visit(element_node) for element_node in node.element_nodes
+        ]
+        return node
+
+    def visit_UnaryOperationNode(self, node: "UnaryOperationNode"):
+        node.node = self.visit(node.node)
+        operand = self.literal(node.node)
+        if operand is None:
+            return node
+
+        error = None
+        if node.operator_token.type == TOKEN_MINUS:
+            if type(operand) is String:
+                return node
+            result, error = operand.multiplied_by(Number(-1))
+        elif node.operator_token.matches(TOKEN_KEYWORD, "not"):
+            result, error = operand.notted()
+
+        if error:
+            return node
+        return self.fold(node, result)
+
+    def visit_BinaryOperationNode(self, node: "BinaryOperationNode"):
+        node.left_node = self.visit(node.left_node)
+        node.right_node = self.visit(node.right_node)
+        left = self.literal(node.left_node)
+        right = self.literal(node.right_node)
+        if left is None or right is None:
+            return node
+
+        operator_token = node.operator_token
+        opcode = BINARY_OPCODES[
+            (
+                operator_token.value
+                if operator_token.type == TOKEN_KEYWORD
+                else operator_token.type
+            )
+        ]
+        if not self.is_foldable(opcode, left, right):
+            return node
+
+        result, error = getattr(left, BINARY_OPERATIONS[opcode])(right)
+        if error:
+            return node
+        return self.fold(node, result)
+
+    def visit_VariableAccessNode(self, node: "VariableAccessNode"):
+        value = self.constants.get(node.variable_name_token.value)
+        if value is None:
+            return node
+        return self.fold(node, value)
+
+    def visit_VariableAssignNode(self, node: "VariableAssignNode"):
+        node.value_node = self.visit(node.value_node)
+        return node
+
+    def visit_IfNode(self, node: "IfNode"):
+        cases = []
+        else_case = node.else_case
+
+        for index, (condition, expr, is_null) in enumerate(node.cases):
+            condition = self.visit(condition)
+            expr = self.visit(expr)
+            value = self.literal(condition)
+            if value is None:
+                cases.append((condition, expr, is_null))
+                continue
+            if not value.is_true():
+                self.note(condition, "removed branch with constant false condition")
+                continue
+            if node.else_case or index + 1 < len(node.cases):
+                self.note(condition, "removed branches after constant true condition")
+            else_case = (expr, is_null)
+            break
+        else:
+            if else_case:
+                expr, is_null = else_case
+                else_case = (self.visit(expr), is_null)
+
+        if cases:
+            node.cases = cases
+            node.else_case = else_case
+            return node
+        if else_case is None:
+            return NumberNode(
+                Token(TOKEN_INT, 0, node.position_start, node.position_end)
+            )
+        expr, is_null = else_case
+        if not is_null:
+            return expr
+        node.cases = [
+            (
+                NumberNode(
+                    Token(TOKEN_INT, 1, node.position_start, node.position_start)
+                ),
+                expr,
+                is_null,
+            )
+        ]
+        node.else_case = None
+        return node
+
+    def visit_ForNode(self, node: "ForNode"):
+        node.start_value = self.visit(node.start_value)
+        node.end_value = self.visit(node.end_value)
+        if node.increment_value:
+            node.increment_value = self.visit(node.increment_value)
+        node.body = self.visit(node.body)
+        return node
+
+    def visit_WhileNode(self, node: "WhileNode"):
+        node.condition = self.visit(node.condition)
+        value = self.literal(node.condition)
+        if value is None or value.is_true():
+            node.body = self.visit(node.body)
+            return node
+
+        self.note(node, "removed loop with constant false condition")
+        if node.is_null:
+            return NumberNode(
+                Token(TOKEN_INT, 0, node.position_start, node.position_end)
+            )
+        return ListNode([], node.position_start, node.position_end)
+
+    def visit_FunctionDefinitionNode(self, node: "FunctionDefinitionNode"):
+        node.body = self.visit(node.body)
+        return node
+
+    def visit_FunctionCallNode(self, node: "FunctionCallNode"):
+        node.node_to_call = self.visit(node.node_to_call)
+        node.arguments = [self.visit(argument_node) for argument_node in node.arguments]
+        return node
+
+    def visit_ReturnNode(self, node: "ReturnNode"):
+        if node.to_return:
+            node.to_return = self.visit(node.to_return)
+        return node
+
+    def visit_ContinueNode(self, node: "ContinueNode"):
+        return node
+
+    def visit_BreakNode(self, node: "BreakNode"):
+        return node
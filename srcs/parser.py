@@ -1,3 +1,4 @@
+from typing import Iterable
 from .base.token import Token
 from .base.constants.tokens import *
 from .base.nodes.binary_operation_node import BinaryOperationNode
@@ -18,28 +19,48 @@ from .base.nodes.return_node import ReturnNode
 from .base.nodes.continue_node import ContinueNode
 from .base.nodes.break_node import BreakNode
 
+EXPRESSION_TOKENS = (
+    TOKEN_INT,
+    TOKEN_FLOAT,
+    TOKEN_STRING,
+    TOKEN_IDENTIFIER,
+    TOKEN_PLUS,
+    TOKEN_MINUS,
+    TOKEN_LPAREN,
+    TOKEN_LSQUARE,
+)
+EXPRESSION_KEYWORDS = (
+    KEYWORD_VARIABLE,
+    "not",
+    "if",
+    "for",
+    "while",
+    KEYWORD_FUNCTION,
+)
+STATEMENT_KEYWORDS = ("return", "continue", "break") + EXPRESSION_KEYWORDS
+
 
 class Parser:
-    def __init__(self, tokens: list["Token"]) -> None:
-        self.tokens = tokens
-        self.token_index = -1
+    def __init__(self, tokens: Iterable["Token"]) -> None:
+        self.tokens = iter(tokens)
         self.current_token: "Token" = None
 
         self.advance()
 
     def advance(self) -> "Token":
-        self.token_index += 1
-        self.update_current_token()
+        if self.current_token is None or self.current_token.type != TOKEN_EOF:
+            self.current_token = next(self.tokens)
         return self.current_token
 
-    def reverse(self, count: int = 1) -> "Token":
-        self.token_index -= count
-        self.update_current_token()
-        return self.current_token
+    def starts_expr(self) -> bool:
+        if self.current_token.type == TOKEN_KEYWORD:
+            return self.current_token.value in EXPRESSION_KEYWORDS
+        return self.current_token.type in EXPRESSION_TOKENS
 
-    def update_current_token(self) -> None:
-        if self.token_index >= 0 and self.token_index < len(self.tokens):
-            self.current_token = self.tokens[self.token_index]
+    def starts_statement(self) -> bool:
+        if self.current_token.type == TOKEN_KEYWORD:
+            return self.current_token.value in STATEMENT_KEYWORDS
+        return self.current_token.type in EXPRESSION_TOKENS
 
     def parse(self) -> "BinaryOperationNode":
         response = self.statements()
@@ -556,21 +577,16 @@ class Parser:
             return response
         statements.append(statement)
 
-        more_statements = True
         while True:
             newline_count = 0
             while self.current_token.type == TOKEN_NEWLINE:
                 response.register_advance(self.advance)
                 newline_count += 1
-            if newline_count == 0:
-                more_statements = False
-            if not more_statements:
+            if newline_count == 0 or not self.starts_statement():
                 break
-            statement = response.try_register(self.statement())
-            if not statement:
-                self.reverse(response.reverse_count)
-                more_statements = False
-                continue
+            statement = response.register(self.statement())
+            if response.error:
+                return response
             statements.append(statement)
 
         return response.success(
@@ -586,9 +602,11 @@ class Parser:
         if self.current_token.matches(TOKEN_KEYWORD, "return"):
             response.register_advance(self.advance)
 
-            expr = response.try_register(self.expr())
-            if not expr:
-                self.reverse(response.reverse_count)
+            expr = None
+            if self.starts_expr():
+                expr = response.register(self.expr())
+                if response.error:
+                    return response
             return response.success(
                 ReturnNode(
                     expr, position_start, self.current_token.position_start.copy()
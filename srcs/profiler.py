@@ -0,0 +1,115 @@
+from time import perf_counter
+from .base.functions.base_function import BaseFunction
+from .base.position import Position
+from .base.run_time_result import RunTimeResult
+
+
+class Profiler:
+    def __init__(self) -> None:
+        self.calls: dict[str, int] = {}
+        self.total_time: dict[str, float] = {}
+        self.self_time: dict[str, float] = {}
+        self.stacks: dict[tuple[str, ...], float] = {}
+        self.active: dict[str, int] = {}
+        self.frames: list[list] = []
+        self.path: list[str] = []
+        self.names: dict[tuple, str] = {}
+        self.originals: dict[tuple[type, str], any] = {}
+
+    def enable(self, name: str = "<program>") -> None:
+        classes = [BaseFunction]
+        while classes:
+            cls = classes.pop()
+            classes.extend(cls.__subclasses__())
+            if "execute" in cls.__dict__ and (cls, "execute") not in self.originals:
+                self.originals[(cls, "execute")] = cls.__dict__["execute"]
+                cls.execute = self.wrap(cls.__dict__["execute"])
+            if (
+                cls is not BaseFunction
+                and "prepare" in cls.__dict__
+                and (cls, "prepare") not in self.originals
+            ):
+                self.originals[(cls, "prepare")] = cls.__dict__["prepare"]
+                cls.prepare = BaseFunction.prepare
+        self.enter(name)
+
+    def disable(self) -> None:
+        self.exit()
+        for (cls, name), method in self.originals.items():
+            setattr(cls, name, method)
+        self.originals.clear()
+
+    def wrap(self, execute):
+        profiler = self
+
+        def profiled_execute(
+            function, arguments, context=None, position_start=None, position_end=None
+        ) -> "RunTimeResult":
+            profiler.enter(profiler.describe(function, position_start))
+            try:
+                return execute(
+                    function, arguments, context, position_start, position_end
+                )
+            finally:
+                profiler.exit()
+
+        return profiled_execute
+
+    def describe(
+        self, function: "BaseFunction", call_position: "Position" = None
+    ) -> str:
+        node = getattr(function, "body_node", None)
+        code = getattr(function, "code", None)
+        key = (function.name, call_position, node, code)
+        name = self.names.get(key)
+        if name is None:
+            if call_position is not None:
+                position = call_position
+            elif node is not None:
+                position = node.position_start
+            elif code is not None and code.positions:
+                position = next(iter(code.positions.values()))[0]
+            else:
+                position = None
+            if position is None:
+                name = f"{function.name} (built-in)"
+            else:
+                name = f"{function.name} ({position.file_name}:{position.line + 1})"
+            self.names[key] = name
+        return name
+
+    def enter(self, name: str) -> None:
+        self.calls[name] = self.calls.get(name, 0) + 1
+        self.active[name] = self.active.get(name, 0) + 1
+        self.path.append(name)
+        self.frames.append([name, perf_counter(), 0.0])
+
+    def exit(self) -> None:
+        name, start, children = self.frames.pop()
+        elapsed = perf_counter() - start
+        self.self_time[name] = self.self_time.get(name, 0.0) + elapsed - children
+        self.active[name] -= 1
+        if not self.active[name]:
+            self.total_time[name] = self.total_time.get(name, 0.0) + elapsed
+        path = tuple(self.path)
+        self.stacks[path] = self.stacks.get(path, 0.0) + elapsed - children
+        self.path.pop()
+        if self.frames:
+            self.frames[-1][2] += elapsed
+
+    def report(self) -> str:
+        lines = [f"{'calls':>10} {'total s':>10} {'self s':>10}  function"]
+        for name in sorted(
+            self.calls, key=lambda name: self.self_time.get(name, 0.0), reverse=True
+        ):
+            lines.append(
+                f"{self.calls[name]:>10} {self.total_time.get(name, 0.0):>10.4f}"
+                f" {self.self_time.get(name, 0.0):>10.4f}  {name}"
+            )
+        return "\n".join(lines)
+
+    def collapsed(self) -> str:
+        return "\n".join(
+            f"{';'.join(path)} {round(elapsed * 1e6)}"
+            for path, elapsed in self.stacks.items()
+        )
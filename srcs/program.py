@@ -0,0 +1,101 @@
+from .interpreter import Interpreter
+from .compiler import Compiler
+from .virtual_machine import VirtualMachine
+from .environment import Environment
+from .profiler import Profiler
+from .base.context import Context
+from .base.value import Value
+from .errors.base_error import BaseError
+from .base.constants.limits import *
+from sys import getrecursionlimit, setrecursionlimit
+
+
+class Program:
+    __slots__ = (
+        "file_name",
+        "node",
+        "report",
+        "bound_names",
+        "global_names",
+        "code",
+    )
+
+    def __init__(
+        self,
+        file_name: str,
+        node,
+        report: list[str],
+        bound_names: set[str],
+        global_names: set[str],
+    ) -> None:
+        self.file_name = file_name
+        self.node = node
+        self.report = report
+        self.bound_names = bound_names
+        self.global_names = global_names
+        self.code = None
+
+    def __getstate__(self) -> tuple:
+        return (
+            self.file_name,
+            self.node,
+            self.report,
+            self.bound_names,
+            self.global_names,
+        )
+
+    def __setstate__(self, state: tuple) -> None:
+        (
+            self.file_name,
+            self.node,
+            self.report,
+            self.bound_names,
+            self.global_names,
+        ) = state
+        self.code = None
+
+    def execute(
+        self,
+        environment: "Environment" = None,
+        bindings: dict[str, any] = None,
+        *,
+        engine: str = "interpreter",
+        max_call_depth: int = MAX_CALL_DEPTH,
+        profiler: "Profiler" = None,
+        caller: "Context" = None,
+        options: dict[str, any] = None,
+    ) -> tuple["Value", BaseError]:
+        setrecursionlimit(max(getrecursionlimit(), max_call_depth * FRAMES_PER_CALL))
+        environment = environment or Environment.root.fork()
+        environment.symbol_table.bound_names.update(self.bound_names)
+        environment.modules.record(self.global_names)
+        for name, value in (bindings or {}).items():
+            environment.define(name, value)
+
+        context = Context("<program>")
+        context.symbol_table = environment.symbol_table
+        context.max_depth = max_call_depth
+        context.environment = environment
+        context.options = {
+            **(options or {}),
+            "engine": engine,
+            "max_call_depth": max_call_depth,
+        }
+        if caller is not None:
+            context.depth = caller.depth
+        if engine == "vm" and self.code is None:
+            self.code = Compiler().compile(self.node)
+        if profiler is not None:
+            profiler.enable(self.file_name)
+        try:
+            if engine == "vm":
+                result = VirtualMachine().run(self.code, context)
+            elif engine == "interpreter":
+                result = Interpreter().visit(self.node, context)
+            else:
+                raise Exception(f"Unknown engine '{engine}'")
+        finally:
+            if profiler is not None:
+                profiler.disable()
+
+        return result.value, result.error
@@ -0,0 +1,86 @@
+import os
+import pickle
+import stat
+from hashlib import sha1
+from sys import implementation
+from .base.constants.version import *
+
+
+class ProgramCache:
+    default: "ProgramCache" = None
+
+    def __init__(self, directory: str = None, in_memory: bool = False) -> None:
+        self.directory = directory
+        self.programs: dict[str, tuple] = {} if in_memory else None
+
+    @classmethod
+    def set_default(cls, cache: "ProgramCache") -> None:
+        cls.default = cache
+
+    def path(self, file_name: str) -> str:
+        file_name = os.path.abspath(file_name)
+        base_name = os.path.basename(file_name) + CACHE_EXTENSION
+        if self.directory is None:
+            return os.path.join(os.path.dirname(file_name), CACHE_DIRECTORY, base_name)
+        digest = sha1(file_name.encode()).hexdigest()[:16]
+        return os.path.join(self.directory, f"{digest}-{base_name}")
+
+    def key(
+        self, file_name: str, optimisation_level: int, is_used: bool = True
+    ) -> tuple:
+        try:
+            status = os.stat(file_name)
+        except OSError:
+            return None
+        return (
+            VERSION,
+            implementation.cache_tag,
+            os.path.abspath(file_name),
+            status.st_mtime_ns,
+            status.st_size,
+            optimisation_level,
+            is_used,
+        )
+
+    def is_trusted(self, status: "os.stat_result") -> bool:
+        if hasattr(os, "getuid") and status.st_uid != os.getuid():
+            return False
+        return not status.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+    def load(self, file_name: str, key: tuple) -> tuple:
+        if self.programs is not None:
+            cached_key, program = self.programs.get(key[2], (None, None))
+            if cached_key == key:
+                return program
+
+        try:
+            with open(self.path(file_name), "rb") as f:
+                if not self.is_trusted(os.fstat(f.fileno())):
+                    return None
+                cached_key, program = pickle.load(f)
+        except Exception:
+            return None
+        if cached_key != key:
+            return None
+        if self.programs is not None:
+            self.programs[key[2]] = (key, program)
+        return program
+
+    def store(self, file_name: str, key: tuple, program: tuple) -> None:
+        if self.programs is not None:
+            self.programs[key[2]] = (key, program)
+        path = self.path(file_name)
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            descriptor = os.open(
+                temporary_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600
+            )
+            with open(descriptor, "wb") as f:
+                pickle.dump((key, program), f, pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary_path, path)
+        except Exception:
+            try:
+                os.remove(temporary_path)
+            except OSError:
+                pass
@@ -0,0 +1,147 @@
+import re
+from typing import Iterator, TextIO
+from .base.position import Position
+from .base.source import Source
+from .base.token import Token
+from .base.constants.tokens import *
+from .base.constants.limits import CHUNK_SIZE
+from .errors.base_error import BaseError
+from .errors.illegal_character_error import IllegalCharacterError
+from .errors.expected_character_error import ExpectedCharacterError
+
+TOKEN_PATTERN = re.compile(
+    r"(?P<SKIP>[ \t]+|#[^;\n]*)"
+    r"|(?P<NEWLINE>[;\n])"
+    r"|(?P<NUMBER>[0-9]+(?:\.[0-9]*)?)"
+    r"|(?P<IDENTIFIER>[A-Za-z][A-Za-z0-9_]*)"
+    r'|(?P<STRING>"[^"]*"?)'
+    r"|(?P<OPERATOR>[=!<>]=|=>|[-+*/%^()\[\],=<>])"
+    r"|(?P<NOT>!)"
+    r"|(?P<ILLEGAL>.)",
+    re.DOTALL,
+)
+OPERATORS = {
+    "+": TOKEN_PLUS,
+    "-": TOKEN_MINUS,
+    "*": TOKEN_MUL,
+    "/": TOKEN_DIV,
+    "%": TOKEN_MOD,
+    "^": TOKEN_POW,
+    "(": TOKEN_LPAREN,
+    ")": TOKEN_RPAREN,
+    "[": TOKEN_LSQUARE,
+    "]": TOKEN_RSQUARE,
+    ",": TOKEN_COMMA,
+    "=": TOKEN_EQ,
+    "==": TOKEN_EEQ,
+    "=>": TOKEN_ARROW,
+    "!=": TOKEN_NEQ,
+    "<": TOKEN_LT,
+    "<=": TOKEN_LTE,
+    ">": TOKEN_GT,
+    ">=": TOKEN_GTE,
+}
+KEYWORD_SET = frozenset(KEYWORDS)
+
+
+class RegexLexer:
+    def __init__(self, file_name: str, text: str = "", stream: "TextIO" = None) -> None:
+        self.file_name = file_name
+        self.text = text
+        self.stream = stream
+        self.source = Source(file_name, text)
+        self.error = None
+
+    def make_tokens(self) -> tuple[list["Token"], BaseError]:
+        tokens = list(self.generate_tokens())
+        if self.error:
+            return [], self.error
+        return tokens, None
+
+    def generate_tokens(self) -> Iterator["Token"]:
+        source = self.source
+        buffer = self.text
+        offset = 0
+        end = 0
+        is_complete = self.stream is None
+
+        while True:
+            if not is_complete:
+                chunk = self.stream.read(CHUNK_SIZE)
+                if chunk:
+                    source.append(chunk)
+                    buffer += chunk
+                else:
+                    is_complete = True
+
+            consumed = 0
+            for match in TOKEN_PATTERN.finditer(buffer):
+                if not is_complete and match.end() == len(buffer):
+                    break
+                consumed = match.end()
+                kind = match.lastgroup
+                if kind == "SKIP":
+                    continue
+                text = match.group()
+                start = offset + match.start()
+                end = offset + consumed
+                position_start = Position(start, source)
+
+                if kind == "OPERATOR":
+                    yield Token(
+                        OPERATORS[text], None, position_start, Position(end, source)
+                    )
+                elif kind == "IDENTIFIER":
+                    yield Token(
+                        TOKEN_KEYWORD if text in KEYWORD_SET else TOKEN_IDENTIFIER,
+                        text,
+                        position_start,
+                        Position(end, source),
+                    )
+                elif kind == "NEWLINE":
+                    yield Token(
+                        TOKEN_NEWLINE,
+                        None,
+                        position_start,
+                        Position(end, source, text == "\n"),
+                    )
+                elif kind == "NUMBER":
+                    yield Token(
+                        TOKEN_FLOAT if "." in text else TOKEN_INT,
+                        float(text) if "." in text else int(text),
+                        position_start,
+                        Position(end, source),
+                    )
+                elif kind == "STRING":
+                    if len(text) > 1 and text.endswith('"'):
+                        text = text[1:-1]
+                    else:
+                        text = text[1:]
+                        end += 1
+                    yield Token(
+                        TOKEN_STRING,
+                        text.replace("\\", ""),
+                        position_start,
+                        Position(end, source),
+                    )
+                else:
+                    if kind == "NOT":
+                        self.error = ExpectedCharacterError(
+                            position_start,
+                            Position(start + 2, source),
+                            "'=' (after '!')",
+                        )
+                    else:
+                        self.error = IllegalCharacterError(
+                            position_start, Position(end, source), f"'{text}'"
+                        )
+                    yield Token(TOKEN_EOF, None, position_start, Position(end, source))
+                    return
+
+            buffer = buffer[consumed:]
+            offset += consumed
+            if is_complete:
+                break
+
+        end = max(end, offset)
+        yield Token(TOKEN_EOF, None, Position(end, source), Position(end + 1, source))
@@ -0,0 +1,215 @@
+from .base.constants.scopes import *
+from .base.constants.tokens import *
+from .base.nodes.number_node import NumberNode
+from .base.nodes.string_node import StringNode
+from .base.nodes.list_node import ListNode
+from .base.nodes.unary_operation_node import UnaryOperationNode
+from .base.nodes.binary_operation_node import BinaryOperationNode
+from .base.nodes.variable_access_node import VariableAccessNode
+from .base.nodes.variable_assign_node import VariableAssignNode
+from .base.nodes.if_node import IfNode
+from .base.nodes.for_node import ForNode
+from .base.nodes.while_node import WhileNode
+from .base.nodes.function_definition_node import FunctionDefinitionNode
+from .base.nodes.function_call_node import FunctionCallNode
+from .base.nodes.return_node import ReturnNode
+from .base.nodes.continue_node import ContinueNode
+from .base.nodes.break_node import BreakNode
+from .node_visitor import NodeVisitor
+
+LAZY_OPERATORS = (
+    TOKEN_PLUS,
+    TOKEN_MINUS,
+    TOKEN_MUL,
+    TOKEN_EEQ,
+    TOKEN_NEQ,
+    TOKEN_LT,
+    TOKEN_LTE,
+    TOKEN_GT,
+    TOKEN_GTE,
+)
+
+
+class Resolver(NodeVisitor):
+    def __init__(self) -> None:
+        self.scopes: list[tuple[dict[str, int], list]] = []
+        self.declared_names: set[str] = set()
+        self.bound_names: set[str] = set()
+        self.global_names: set[str] = set()
+        self.functions: list[list] = []
+
+    def resolve(self, node, is_used: bool = True):
+        if not is_used:
+            self.discard(node)
+        self.visit(node)
+        return node
+
+    def declare(self, node, name: str) -> None:
+        self.declared_names.add(name)
+        if not self.scopes:
+            node.depth = DEPTH_GLOBAL
+            self.global_names.add(name)
+            return
+        layout, _ = self.scopes[-1]
+        node.depth = DEPTH_LOCAL
+        node.slot = layout.setdefault(name, len(layout))
+
+    def access(self, node: "VariableAccessNode") -> None:
+        if not self.scopes:
+            node.depth = DEPTH_GLOBAL
+            return
+        _, accesses = self.scopes[-1]
+        accesses.append(node)
+
+    def discard(self, node) -> None:
+        if type(node) in (ListNode, IfNode, ForNode, WhileNode):
+            node.is_used = False
+
+    def is_lazy(self, node, name: str) -> bool:
+        if type(node) is NumberNode:
+            return True
+        if type(node) is VariableAccessNode:
+            return node.variable_name_token.value == name
+        if type(node) is UnaryOperationNode:
+            return self.is_lazy(node.node, name)
+        if type(node) is BinaryOperationNode:
+            operator_token = node.operator_token
+            return (
+                (
+                    operator_token.type in LAZY_OPERATORS
+                    or operator_token.matches(TOKEN_KEYWORD, KEYWORD_AND)
+                    or operator_token.matches(TOKEN_KEYWORD, KEYWORD_OR)
+                )
+                and self.is_lazy(node.left_node, name)
+                and self.is_lazy(node.right_node, name)
+            )
+        return False
+
+    def tail(self, node) -> None:
+        name, loops = self.functions[-1]
+        if loops:
+            return
+        if type(node) is FunctionCallNode:
+            node_to_call = node.node_to_call
+            node.is_tail = (
+                type(node_to_call) is VariableAccessNode
+                and node_to_call.variable_name_token.value == name
+            )
+        elif type(node) is IfNode:
+            for _, expr, is_null in node.cases:
+                if not is_null:
+                    self.tail(expr)
+            if node.else_case and not node.else_case[1]:
+                self.tail(node.else_case[0])
+
+    def visit_NumberNode(self, _: "NumberNode") -> None:
+        pass
+
+    def visit_StringNode(self, _: "StringNode") -> None:
+        pass
+
+    def visit_ListNode(self, node: "ListNode") -> None:
+        for element_node in node.element_nodes:
+            if not node.is_used:
+                self.discard(element_node)
+            self.visit(element_node)
+
+    def visit_UnaryOperationNode(self, node: "UnaryOperationNode") -> None:
+        self.visit(node.node)
+
+    def visit_BinaryOperationNode(self, node: "BinaryOperationNode") -> None:
+        self.visit(node.left_node)
+        self.visit(node.right_node)
+
+    def visit_VariableAccessNode(self, node: "VariableAccessNode") -> None:
+        self.access(node)
+
+    def visit_VariableAssignNode(self, node: "VariableAssignNode") -> None:
+        self.visit(node.value_node)
+        self.declare(node, node.variable_name_token.value)
+
+    def visit_IfNode(self, node: "IfNode") -> None:
+        for condition, expr, is_null in node.cases:
+            if is_null or not node.is_used:
+                self.discard(expr)
+            self.visit(condition)
+            self.visit(expr)
+        if node.else_case:
+            expr, is_null = node.else_case
+            if is_null or not node.is_used:
+                self.discard(expr)
+            self.visit(expr)
+
+    def visit_ForNode(self, node: "ForNode") -> None:
+        self.visit(node.start_value)
+        self.visit(node.end_value)
+        if node.increment_value:
+            self.visit(node.increment_value)
+        self.declare(node, node.token.value)
+        if node.is_null or not node.is_used:
+            self.discard(node.body)
+        else:
+            node.is_lazy = self.is_lazy(node.body, node.token.value)
+        self.visit_in_loop(node.body)
+
+    def visit_WhileNode(self, node: "WhileNode") -> None:
+        self.visit(node.condition)
+        if node.is_null or not node.is_used:
+            self.discard(node.body)
+        self.visit_in_loop(node.body)
+
+    def visit_in_loop(self, node) -> None:
+        if self.functions:
+            self.functions[-1][1] += 1
+            self.visit(node)
+            self.functions[-1][1] -= 1
+        else:
+            self.visit(node)
+
+    def visit_FunctionDefinitionNode(self, node: "FunctionDefinitionNode") -> None:
+        layout = {}
+        accesses = []
+        for argument in node.arguments:
+            layout.setdefault(argument.value, len(layout))
+            self.declared_names.add(argument.value)
+
+        if not node.is_automatic_return:
+            self.discard(node.body)
+        self.functions.append([node.token.value if node.token else None, 0])
+        if node.is_automatic_return:
+            self.tail(node.body)
+        self.scopes.append((layout, accesses))
+        self.visit(node.body)
+        self.scopes.pop()
+        self.functions.pop()
+
+        for access_node in accesses:
+            slot = layout.get(access_node.variable_name_token.value)
+            if slot is None:
+                access_node.depth = DEPTH_GLOBAL
+            else:
+                access_node.depth = DEPTH_LOCAL
+                access_node.slot = slot
+
+        node.layout = layout
+        self.bound_names.update(layout)
+
+        if node.token:
+            self.declare(node, node.token.value)
+
+    def visit_FunctionCallNode(self, node: "FunctionCallNode") -> None:
+        self.visit(node.node_to_call)
+        for argument_node in node.arguments:
+            self.visit(argument_node)
+
+    def visit_ReturnNode(self, node: "ReturnNode") -> None:
+        if node.to_return:
+            if self.functions:
+                self.tail(node.to_return)
+            self.visit(node.to_return)
+
+    def visit_ContinueNode(self, _: "ContinueNode") -> None:
+        pass
+
+    def visit_BreakNode(self, _: "BreakNode") -> None:
+        pass
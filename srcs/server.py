@@ -0,0 +1,59 @@
+import os
+import stat
+from socketserver import UnixStreamServer
+from .shell import execute
+from .server_handler import ServerHandler
+from .base.constants.limits import MAX_CALL_DEPTH
+
+
+class Server(UnixStreamServer):
+    def __init__(self, path: str) -> None:
+        if self.is_socket(path):
+            os.remove(path)
+        elif os.path.lexists(path):
+            raise Exception(f"'{path}' exists and is not a socket")
+        self.path = path
+        super().__init__(path, ServerHandler)
+
+    def server_bind(self) -> None:
+        umask = os.umask(0o077)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(umask)
+        os.chmod(self.path, 0o600)
+
+    @staticmethod
+    def is_socket(path: str) -> bool:
+        try:
+            return stat.S_ISSOCK(os.lstat(path).st_mode)
+        except OSError:
+            return False
+
+    def execute(self, request: dict) -> dict:
+        directory = os.getcwd()
+        try:
+            os.chdir(request.get("cwd", directory))
+            return execute(
+                request["file_name"],
+                request.get("text"),
+                request.get("report", False),
+                engine=request.get("engine", "interpreter"),
+                optimisation_level=request.get("optimisation_level", 0),
+                max_call_depth=request.get("max_call_depth", MAX_CALL_DEPTH),
+                lexer=request.get("lexer", "character"),
+            )
+        except Exception as e:
+            return {
+                "output": "",
+                "error": e.__class__.__name__ + ": " + str(e),
+                "report": None,
+                "time": 0,
+            }
+        finally:
+            os.chdir(directory)
+
+    def server_close(self) -> None:
+        super().server_close()
+        if self.is_socket(self.path):
+            os.remove(self.path)
@@ -0,0 +1,15 @@
+import json
+from socketserver import StreamRequestHandler
+
+
+class ServerHandler(StreamRequestHandler):
+    def handle(self) -> None:
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+            except ValueError as e:
+                response = {"output": "", "error": f"Invalid request: {e}", "time": 0}
+            else:
+                response = self.server.execute(request)
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
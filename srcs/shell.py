@@ -1,46 +1,149 @@
 from .lexer import Lexer
+from .regex_lexer import RegexLexer
 from .parser import Parser
-from .interpreter import Interpreter
-from .base.context import Context
+from .resolver import Resolver
+from .optimizer import Optimizer
+from .program import Program
+from .program_cache import ProgramCache
+from .profiler import Profiler
+from .environment import Environment
 from .base.token import Token
+from .base.context import Context
 from .errors.base_error import BaseError
-from .base.symbol_table import SymbolTable
-from .base.number import Number
-from .base.functions.builtin_function import BuiltInFunction
-
-global_symbol_table = SymbolTable()
-global_symbol_table.set("null", Number.null)
-global_symbol_table.set("false", Number.false)
-global_symbol_table.set("true", Number.true)
-global_symbol_table.set("PI", Number.PI)
-global_symbol_table.set("print", BuiltInFunction.print)
-global_symbol_table.set("input", BuiltInFunction.input)
-global_symbol_table.set("clear", BuiltInFunction.clear)
-global_symbol_table.set("len", BuiltInFunction.len)
-global_symbol_table.set("is_number", BuiltInFunction.is_number)
-global_symbol_table.set("is_string", BuiltInFunction.is_string)
-global_symbol_table.set("is_list", BuiltInFunction.is_list)
-global_symbol_table.set("is_function", BuiltInFunction.is_function)
-global_symbol_table.set("append", BuiltInFunction.append)
-global_symbol_table.set("pop", BuiltInFunction.pop)
-global_symbol_table.set("extend", BuiltInFunction.extend)
-global_symbol_table.set("run", BuiltInFunction.run)
-
-
-def run(file_name: str, text: str) -> tuple[list["Token"], BaseError]:
-    lexer = Lexer(file_name, text)
-    tokens, error = lexer.make_tokens()
-    if error:
-        return [], error
+from .base.constants.limits import *
+from contextlib import nullcontext
+from io import StringIO
+from time import perf_counter
+from sys import getrecursionlimit, setrecursionlimit
+from typing import TextIO
+
+LEXERS = {"character": Lexer, "regex": RegexLexer}
+
+
+def parse(
+    file_name: str,
+    text: str = "",
+    optimisation_level: int = 0,
+    lexer: str = "character",
+    stream: "TextIO" = None,
+    environment: "Environment" = None,
+    is_used: bool = True,
+) -> tuple["Program", BaseError]:
+    if lexer not in LEXERS:
+        raise Exception(f"Unknown lexer '{lexer}'")
+    lexer = LEXERS[lexer](file_name, text, stream)
+    tokens = lexer.generate_tokens()
 
     parser = Parser(tokens)
     ast = parser.parse()
+    for _ in tokens:
+        pass
+    if lexer.error:
+        return None, lexer.error
     if ast.error:
-        return [], ast.error
+        return None, ast.error
+    resolver = Resolver()
+    node = resolver.resolve(ast.node, is_used)
+    optimizer = Optimizer(
+        optimisation_level,
+        (environment or Environment.root).symbol_table,
+        resolver.declared_names,
+    )
+    node = optimizer.optimize(node)
+    return (
+        Program(
+            file_name,
+            node,
+            optimizer.report,
+            resolver.bound_names,
+            resolver.global_names,
+        ),
+        None,
+    )
+
+
+def compile(
+    source: str,
+    file_name: str = "<program>",
+    optimisation_level: int = 0,
+    lexer: str = "character",
+    environment: "Environment" = None,
+) -> tuple["Program", BaseError]:
+    setrecursionlimit(max(getrecursionlimit(), MAX_CALL_DEPTH * FRAMES_PER_CALL))
+    return parse(file_name, source, optimisation_level, lexer, environment=environment)
+
+
+def run(
+    file_name: str,
+    text: str = "",
+    engine: str = "interpreter",
+    optimisation_level: int = 0,
+    report: list[str] = None,
+    max_call_depth: int = MAX_CALL_DEPTH,
+    lexer: str = "character",
+    stream: "TextIO" = None,
+    cache: "ProgramCache" = None,
+    environment: "Environment" = None,
+    profiler: "Profiler" = None,
+    is_used: bool = True,
+    caller: "Context" = None,
+) -> tuple[list["Token"], BaseError]:
+    environment = environment or Environment.root.fork()
+    setrecursionlimit(max(getrecursionlimit(), max_call_depth * FRAMES_PER_CALL))
+    cache = cache or ProgramCache.default
+    key = None
+    if cache and stream and not text:
+        key = cache.key(file_name, optimisation_level, is_used)
+    program = cache.load(file_name, key) if key else None
+    if program is None:
+        program, error = parse(
+            file_name, text, optimisation_level, lexer, stream, environment, is_used
+        )
+        if error:
+            return [], error
+        if key:
+            cache.store(file_name, key, program)
+
+    if report is not None:
+        report.extend(program.report)
+    return program.execute(
+        environment,
+        engine=engine,
+        max_call_depth=max_call_depth,
+        profiler=profiler,
+        caller=caller,
+        options={"optimisation_level": optimisation_level, "lexer": lexer},
+    )
 
-    interpreter = Interpreter()
-    context = Context("<program>")
-    context.symbol_table = global_symbol_table
-    result = interpreter.visit(ast.node, context)
 
-    return result.value, result.error
+def execute(
+    file_name: str, text: str = None, report: bool = False, **options
+) -> dict[str, any]:
+    output = StringIO()
+    error = None
+    report = [] if report else None
+    environment = Environment.root.fork(output, StringIO())
+    start = perf_counter()
+    environment.modules.begin(file_name)
+    try:
+        with open(file_name, "r") if text is None else nullcontext() as f:
+            _, error = run(
+                file_name,
+                text or "",
+                report=report,
+                stream=f,
+                environment=environment,
+                is_used=False,
+                **options,
+            )
+        error = error.as_string() if error else None
+    except Exception as e:
+        error = e.__class__.__name__ + ": " + str(e)
+    finally:
+        environment.modules.end()
+    return {
+        "output": output.getvalue(),
+        "error": error,
+        "report": report,
+        "time": perf_counter() - start,
+    }
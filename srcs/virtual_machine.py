@@ -0,0 +1,244 @@
+from .base.code import Code
+from .base.context import Context
+from .base.number import Number
+from .base.list import List
+from .base.run_time_result import RunTimeResult
+from .base.functions.function import Function
+from .base.constants.opcodes import *
+from .errors.run_time_error import RunTimeError
+
+NUMBER_OPERATIONS = (
+    lambda left, right: left + right,
+    lambda left, right: left - right,
+    lambda left, right: left * right,
+    lambda left, right: left / right,
+    lambda left, right: left % right,
+    None,
+    lambda left, right: int(left == right),
+    lambda left, right: int(left != right),
+    lambda left, right: int(left < right),
+    lambda left, right: int(left <= right),
+    lambda left, right: int(left > right),
+    lambda left, right: int(left >= right),
+    lambda left, right: int(left and right),
+    lambda left, right: int(left or right),
+)
+DIVISIONS = (OP_DIVIDE, OP_MODULO)
+
+
+class VirtualMachine:
+    def __init__(self) -> None:
+        pass
+
+    def run(self, code: "Code", context: "Context") -> "RunTimeResult":
+        instructions = code.instructions.tolist()
+        constants = code.constants
+        names = code.names
+        symbol_table = context.symbol_table
+        slots = symbol_table.slots if code.layout is not None else None
+        global_table = symbol_table.globals.table
+        bound_names = symbol_table.bound_names
+        number = Number.of
+        stack = []
+        blocks = []
+        push = stack.append
+        pop = stack.pop
+        pc = 0
+
+        while True:
+            opcode = instructions[pc]
+            argument = instructions[pc + 1]
+            pc += 2
+
+            if opcode == OP_LOAD_LOCAL:
+                value = slots[argument]
+                if value is None:
+                    name = code.local_names[argument]
+                    value = symbol_table.parent.get(name)
+                    if value is None:
+                        return self.failure(
+                            code, pc, f"'{name}' is not defined", context
+                        )
+                push(value)
+
+            elif opcode == OP_LOAD_CONST:
+                push(constants[argument])
+
+            elif opcode == OP_LOAD_GLOBAL:
+                name = names[argument]
+                if name in bound_names:
+                    value = symbol_table.get(name)
+                else:
+                    value = global_table.get(name)
+                if value is None:
+                    return self.failure(code, pc, f"'{name}' is not defined", context)
+                push(value)
+
+            elif opcode <= OP_OR:
+                right = pop()
+                left = stack[-1]
+                if type(left) is Number and type(right) is Number:
+                    operation = NUMBER_OPERATIONS[opcode]
+                    if operation and (right.value or opcode not in DIVISIONS):
+                        stack[-1] = number(operation(left.value, right.value))
+                        continue
+                result, error = getattr(left, BINARY_OPERATIONS[opcode])(right)
+                if error:
+                    return self.anchor(code, pc, error, context)
+                stack[-1] = result
+
+            elif opcode == OP_STORE_LOCAL:
+                slots[argument] = pop()
+
+            elif opcode == OP_STORE_NAME:
+                symbol_table.set(names[argument], pop())
+
+            elif opcode == OP_POP_JUMP_IF_FALSE:
+                value = pop()
+                if not (value.value != 0 if type(value) is Number else value.is_true()):
+                    pc = argument
+
+            elif opcode == OP_JUMP:
+                pc = argument
+
+            elif opcode == OP_FOR_ITERATE:
+                state = stack[-1]
+                i, end, increment = state
+                if i <= end if increment >= 0 else i >= end:
+                    push(number(i))
+                    state[0] = i + increment
+                else:
+                    pc = argument
+
+            elif opcode == OP_DUPLICATE:
+                push(stack[-1])
+
+            elif opcode == OP_POP:
+                pop()
+
+            elif opcode == OP_LIST_APPEND:
+                value = pop()
+                stack[-argument].elements.append(value)
+
+            elif opcode == OP_CALL or opcode == OP_TAIL_CALL:
+                arguments = stack[len(stack) - argument :]
+                del stack[len(stack) - argument :]
+                value_to_call = pop()
+                if (
+                    opcode == OP_TAIL_CALL
+                    and type(value_to_call) is Function
+                    and value_to_call.code is code
+                    and argument == len(code.argument_names)
+                ):
+                    value_to_call.populate_arguments(
+                        code.argument_names, arguments, context
+                    )
+                    del stack[:]
+                    pc = 0
+                    continue
+                start, end = code.positions[pc - 2]
+                response = value_to_call.execute(arguments, context, start, end)
+                if response.error:
+                    return RunTimeResult().failure(response.error)
+                if response.continue_loop or response.break_loop:
+                    if not blocks:
+                        return response
+                    continue_pc, break_pc, depth = blocks[-1]
+                    del stack[depth:]
+                    pc = continue_pc if response.continue_loop else break_pc
+                    continue
+                push(response.value)
+
+            elif opcode == OP_BUILD_LIST:
+                if argument:
+                    elements = stack[len(stack) - argument :]
+                    del stack[len(stack) - argument :]
+                else:
+                    elements = []
+                push(List(elements))
+
+            elif opcode == OP_NEGATE:
+                value = stack[-1]
+                if type(value) is Number:
+                    stack[-1] = number(value.value * -1)
+                    continue
+                result, error = value.multiplied_by(Number.of(-1))
+                if error:
+                    return self.anchor(code, pc, error, context)
+                stack[-1] = result
+
+            elif opcode == OP_NOT:
+                result, error = stack[-1].notted()
+                if error:
+                    return self.anchor(code, pc, error, context)
+                stack[-1] = result
+
+            elif opcode == OP_CONTINUE_LOOP:
+                if not blocks:
+                    return RunTimeResult().success_continue()
+                pc, _, depth = blocks[-1]
+                del stack[depth:]
+
+            elif opcode == OP_BREAK_LOOP:
+                if not blocks:
+                    return RunTimeResult().success_break()
+                _, pc, depth = blocks[-1]
+                del stack[depth:]
+
+            elif opcode == OP_SETUP_LOOP:
+                blocks.append((pc, argument, len(stack)))
+
+            elif opcode == OP_POP_BLOCK:
+                blocks.pop()
+
+            elif opcode == OP_FOR_PREPARE:
+                increment = pop()
+                end = pop()
+                start = pop()
+                push([start.value, end.value, increment.value])
+
+            elif opcode == OP_MAKE_FUNCTION:
+                function_code: "Code" = constants[argument]
+                start, end = code.positions[pc - 2]
+                push(
+                    Function(
+                        function_code.name,
+                        None,
+                        function_code.argument_names,
+                        function_code.is_automatic_return,
+                        function_code,
+                        function_code.layout,
+                    )
+                    .set_context(context)
+                    .set_position(start, end)
+                )
+
+            elif opcode == OP_RETURN_VALUE:
+                return RunTimeResult().success_return(pop())
+
+            elif opcode == OP_LOAD_NAME:
+                value = symbol_table.get(names[argument])
+                if value is None:
+                    return self.failure(
+                        code, pc, f"'{names[argument]}' is not defined", context
+                    )
+                push(value)
+
+            elif opcode == OP_HALT:
+                return RunTimeResult().success(pop())
+
+            else:
+                raise Exception(f"Unknown opcode {opcode}")
+
+    def failure(
+        self, code: "Code", pc: int, details: str, context: "Context"
+    ) -> "RunTimeResult":
+        start, end = code.positions[pc - 2]
+        return RunTimeResult().failure(RunTimeError(start, end, details, context))
+
+    def anchor(
+        self, code: "Code", pc: int, error: "RunTimeError", context: "Context"
+    ) -> "RunTimeResult":
+        error.position_start, error.position_end = code.positions[pc - 2]
+        error.context = context
+        return RunTimeResult().failure(error)